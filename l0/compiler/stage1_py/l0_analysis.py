@@ -7,7 +7,7 @@ from typing import Dict, List, Optional, Tuple
 
 from l0_compilation import CompilationUnit
 from l0_context import CompilationContext
-from l0_diagnostics import Diagnostic
+from l0_diagnostics import Diagnostic, index_diagnostics_by_code
 from l0_locals import FunctionEnv
 from l0_signatures import StructInfo, EnumInfo
 from l0_symbols import ModuleEnv
@@ -77,6 +77,15 @@ class AnalysisResult:
         """
         return any(d.kind == "warning" for d in self.diagnostics)
 
+    def diagnostics_by_code(self) -> Dict[str, List[Diagnostic]]:
+        """Group the accumulated diagnostics by diagnostic code.
+
+        Returns:
+            A mapping from diagnostic code (e.g., "TYP-0024") to the diagnostics
+            carrying that code, in reporting order.
+        """
+        return index_diagnostics_by_code(self.diagnostics)
+
     def is_arc_type(self, ty: Type) -> bool:
         """Check if a type requires Automatic Reference Counting (ARC).
 
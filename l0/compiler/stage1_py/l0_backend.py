@@ -3195,20 +3195,11 @@ class Backend:
         Returns:
             The EnumVariant AST node if found, otherwise None.
         """
-        module = self.analysis.cu.modules.get(module_name)
-        if not module:
+        enum_info = self.analysis.enum_infos.get((module_name, enum_name))
+        if enum_info is None:
             return None
-
-        # Find the enum declaration
-        for decl in module.decls:
-            if isinstance(decl, EnumDecl) and decl.name == enum_name:
-                # Find the variant within the enum
-                for variant in decl.variants:
-                    if variant.name == variant_name:
-                        return variant
-                break
-
-        return None
+        variant_info = enum_info.variants.get(variant_name)
+        return variant_info.decl if variant_info is not None else None
 
     # -------------------------------------------------------------------------
     # Utilities
@@ -160,17 +160,11 @@ class CEmitter:
         Returns:
             The EnumVariant node if found, otherwise None.
         """
-        if self.analysis.cu is None:
-            return None
-        module = self.analysis.cu.modules.get(module_name)
-        if not module:
+        enum_info = self.analysis.enum_infos.get((module_name, enum_name))
+        if enum_info is None:
             return None
-        for decl in module.decls:
-            if isinstance(decl, EnumDecl) and decl.name == enum_name:
-                for variant in decl.variants:
-                    if variant.name == variant_name:
-                        return variant
-        return None
+        variant_info = enum_info.variants.get(variant_name)
+        return variant_info.decl if variant_info is not None else None
 
     def ice(self, message: str, node: Optional[object] = None) -> NoReturn:
         """Raise an internal compiler error with context.
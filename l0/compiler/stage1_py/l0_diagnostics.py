@@ -8,8 +8,9 @@ creating diagnostics from AST nodes and tokens.
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from l0_ast import Node
 
@@ -207,6 +208,9 @@ DIAGNOSTIC_CODE_FAMILIES = {
     ],
 }
 
+# Matches the bracketed code embedded in diagnostic messages, e.g. "[TYP-0024]".
+_DIAGNOSTIC_CODE_RE = re.compile(r"\[([A-Z][A-Z0-9]{2}-\d{4})\]")
+
 
 @dataclass
 class Diagnostic:
@@ -221,6 +225,9 @@ class Diagnostic:
         column: 1-based column number of the start of the diagnostic.
         end_line: 1-based line number of the end of the diagnostic.
         end_column: 1-based column number of the end of the diagnostic.
+        code: The diagnostic code embedded in the message, without brackets
+            (e.g., "TYP-0024"), or None if the message carries no code.
+            Parsed once from the message at construction.
     """
     kind: str
     message: str
@@ -235,6 +242,12 @@ class Diagnostic:
     end_line: Optional[int] = None
     end_column: Optional[int] = None
 
+    code: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        match = _DIAGNOSTIC_CODE_RE.search(self.message)
+        self.code = match.group(1) if match is not None else None
+
     def format(self) -> str:
         """Format the diagnostic as a one-line string header.
 
@@ -255,6 +268,26 @@ class Diagnostic:
         return f"{loc}{self.kind}: {self.message}"
 
 
+def index_diagnostics_by_code(diagnostics: Iterable[Diagnostic]) -> Dict[str, List[Diagnostic]]:
+    """Group diagnostics by their embedded diagnostic code.
+
+    Diagnostics without a code are omitted. Within each group, the original
+    order is preserved.
+
+    Args:
+        diagnostics: The diagnostics to index.
+
+    Returns:
+        A mapping from diagnostic code (e.g., "TYP-0024") to the diagnostics
+        carrying that code.
+    """
+    by_code: Dict[str, List[Diagnostic]] = {}
+    for diag in diagnostics:
+        if (code := diag.code) is not None:
+            by_code.setdefault(code, []).append(diag)
+    return by_code
+
+
 def diag_from_node(
         kind: str,
         message: str,
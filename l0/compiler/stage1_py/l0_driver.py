@@ -1,8 +1,9 @@
 #  SPDX-License-Identifier: MIT OR Apache-2.0
 #  Copyright (c) 2025-2026 gwz
 
+import hashlib
 from pathlib import Path
-from typing import Dict, Set, List
+from typing import Dict, Set, List, Tuple
 
 from l0_analysis import AnalysisResult
 from l0_ast import Module
@@ -76,6 +77,12 @@ def load_source_utf8(path: str | Path) -> str:
     return text
 
 
+# Parsed modules keyed by source path and content digest. Parsing is
+# context-free, so an unchanged file always yields the same AST and the same
+# lexer/parser diagnostics.
+ParseCache = Dict[Tuple[str, bytes], Tuple[Module, Tuple[Diagnostic, ...]]]
+
+
 class L0Driver:
     """Stage-1 driver for the L0 compiler.
 
@@ -89,6 +96,7 @@ class L0Driver:
       - analyze(name): High-level analysis pipeline for an entry module.
       - build_compilation_unit(name): Build a closed set of modules for an entry.
       - load_module(name): Load by dotted module name, recursively loading imports.
+      - parse_file(path): Parse one file without imports or semantic passes.
       - load_single_file(path): Ad hoc one-off parsing (no import resolution).
     """
 
@@ -96,6 +104,7 @@ class L0Driver:
             self,
             search_paths: SourceSearchPaths | None = None,
             context: CompilationContext | None = None,
+            parse_cache: ParseCache | None = None,
     ):
         """Initialize the L0 driver.
 
@@ -104,12 +113,16 @@ class L0Driver:
                 of search paths.
             context: Compilation context for configuration and logging. Defaults
                 to CompilationContext.default().
+            parse_cache: Optional parse cache to share with other drivers. When
+                omitted, every file is lexed and parsed afresh.
         """
         self.search_paths = search_paths or SourceSearchPaths()
         self.context = context or CompilationContext.default()
         self.diagnostics: List[Diagnostic] = []
         # Modules successfully loaded (by module name).
         self.module_cache: Dict[str, Module] = {}
+        # Parse results shared with other drivers, if the caller opted in.
+        self.parse_cache = parse_cache
         # Modules currently being loaded (for cycle detection).
         self._loading: Set[str] = set()
 
@@ -140,18 +153,7 @@ class L0Driver:
         try:
             cu = self.build_compilation_unit(entry_module_name)
         except (FileNotFoundError, ValueError, ImportCycleError, SourceEncodingError) as e:
-            # Transfer all collected lexer/parser diagnostics
-            result.diagnostics.extend(self.diagnostics)
-            # If no specific diagnostic was collected but we have an exception, add it
-            if not result.diagnostics:
-                if isinstance(e, FileNotFoundError):
-                    result.diagnostics.append(Diagnostic(kind="error", message=f"file: [DRV-0010] {str(e)}"))
-                elif isinstance(e, ValueError):
-                    result.diagnostics.append(Diagnostic(kind="error", message=f"input: [DRV-0020] {str(e)}"))
-                elif isinstance(e, ImportCycleError):
-                    result.diagnostics.append(Diagnostic(kind="error", message=f"import: [DRV-0030] {str(e)}"))
-                elif isinstance(e, SourceEncodingError):
-                    result.diagnostics.append(Diagnostic(kind="error", message=f"input: [DRV-0040] {e}"))
+            self._report_load_failure(result, e)
             return result
 
         result.cu = cu
@@ -201,6 +203,31 @@ class L0Driver:
                  f"Analysis complete: {len(result.diagnostics)} total diagnostic(s), {len([d for d in result.diagnostics if d.kind == 'error'])} error(s)")
         return result
 
+    def parse_file(self, path: str | Path) -> AnalysisResult:
+        """Lex and parse a single source file without semantic analysis.
+
+        Imports are not loaded and no resolver or type checker runs. Useful
+        for callers that only need the AST or the lexer/parser diagnostics.
+
+        Args:
+            path: Path to the source file.
+
+        Returns:
+            An AnalysisResult whose compilation unit holds only the parsed
+            module, together with the lexer/parser diagnostics. If the file
+            cannot be read, the compilation unit is None.
+        """
+        result = AnalysisResult(cu=None, context=self.context)
+        try:
+            module = self._load_single_file(path)
+        except (FileNotFoundError, ValueError, SourceEncodingError) as e:
+            self._report_load_failure(result, e)
+            return result
+
+        result.cu = CompilationUnit(entry_module=module, modules={module.name: module})
+        result.diagnostics.extend(self.diagnostics)
+        return result
+
     def build_compilation_unit(self, entry_module_name: str) -> CompilationUnit:
         """Build a compilation unit for an entry module.
 
@@ -288,6 +315,26 @@ class L0Driver:
 
     # --- Internal helpers ---
 
+    def _report_load_failure(self, result: AnalysisResult, e: Exception) -> None:
+        """Record a failure to load sources into an analysis result.
+
+        Args:
+            result: The result to receive the diagnostics.
+            e: The exception raised while loading or parsing.
+        """
+        # Transfer all collected lexer/parser diagnostics
+        result.diagnostics.extend(self.diagnostics)
+        # If no specific diagnostic was collected but we have an exception, add it
+        if not result.diagnostics:
+            if isinstance(e, FileNotFoundError):
+                result.diagnostics.append(Diagnostic(kind="error", message=f"file: [DRV-0010] {str(e)}"))
+            elif isinstance(e, ValueError):
+                result.diagnostics.append(Diagnostic(kind="error", message=f"input: [DRV-0020] {str(e)}"))
+            elif isinstance(e, ImportCycleError):
+                result.diagnostics.append(Diagnostic(kind="error", message=f"import: [DRV-0030] {str(e)}"))
+            elif isinstance(e, SourceEncodingError):
+                result.diagnostics.append(Diagnostic(kind="error", message=f"input: [DRV-0040] {e}"))
+
     def _load_single_file(self, path: str | Path) -> Module:
         """Load a single file as a parsed module.
 
@@ -314,6 +361,10 @@ class L0Driver:
     def _parse_source(self, text: str, file_path: str) -> Module:
         """Tokenize and parse source text.
 
+        When the driver was given a `parse_cache` and the same path is parsed
+        again with identical content, the cached AST is reused and its
+        lexer/parser diagnostics are replayed into this driver.
+
         Args:
             text: The source code text.
             file_path: The path to the file (for diagnostics).
@@ -321,15 +372,33 @@ class L0Driver:
         Returns:
             The parsed Module object.
         """
-        log_debug(self.context, f"Lexing {file_path}")
-        lexer = Lexer(text, filename=file_path, diagnostics=self.diagnostics)
-        tokens = lexer.tokenize()
-        log_debug(self.context, f"Lexed {len(tokens)} token(s) from {file_path}")
-
-        log_debug(self.context, f"Parsing {file_path}")
-        parser = Parser(tokens, diagnostics=self.diagnostics)
-        module = parser.parse_module(filename=file_path)
-        log_debug(self.context, f"Parsed module '{module.name}' from {file_path}")
+        key = None
+        if self.parse_cache is not None:
+            key = (file_path, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+            cached = self.parse_cache.get(key)
+            if cached is not None:
+                module, cached_diagnostics = cached
+                log_debug(self.context, f"Reusing parsed module '{module.name}' from {file_path}")
+                self.diagnostics.extend(cached_diagnostics)
+                self.module_cache[module.name] = module
+                return module
+
+        diagnostics: List[Diagnostic] = []
+        try:
+            log_debug(self.context, f"Lexing {file_path}")
+            lexer = Lexer(text, filename=file_path, diagnostics=diagnostics)
+            tokens = lexer.tokenize()
+            log_debug(self.context, f"Lexed {len(tokens)} token(s) from {file_path}")
+
+            log_debug(self.context, f"Parsing {file_path}")
+            parser = Parser(tokens, diagnostics=diagnostics)
+            module = parser.parse_module(filename=file_path)
+            log_debug(self.context, f"Parsed module '{module.name}' from {file_path}")
+        finally:
+            self.diagnostics.extend(diagnostics)
+
+        if key is not None:
+            self.parse_cache[key] = (module, tuple(diagnostics))
 
         # Ensure any parsed module (even via load_single_file) appears in cache.
         self.module_cache[module.name] = module
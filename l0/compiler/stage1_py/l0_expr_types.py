@@ -195,16 +195,21 @@ class ExpressionTypeChecker:
         """
         assert self._local_scopes, "no active scope"
         local = self._local_scopes[-1]
-        if name in local:
+        existing = local.get(name)
+        if existing is not None:
             self._error(node,
-                        f"[TYP-0020] local variable '{name}' already declared in this scope with type '{format_type(local[name])}'")
+                        f"[TYP-0020] local variable '{name}' already declared in this scope with type '{format_type(existing)}'")
             return None
 
         if self._lookup_local(name) is not None:
             self._warn(node, f"[TYP-0021] local variable '{name}' shadows variable from outer scope")
 
-        if self._current_func_env is not None:
-            module_name = self._current_func_env.module_name
+        func_env = self._current_func_env
+        module_env = self.module_envs.get(func_env.module_name) if func_env is not None else None
+        # Reject by name first: most locals collide with no module-level or imported
+        # symbol, so the full resolution below only runs for actual collisions.
+        if module_env is not None and (name in module_env.all or name in module_env.ambiguous_imports):
+            module_name = func_env.module_name
             sym_result = resolve_symbol(self.module_envs, module_name, name)
             sym = sym_result.symbol
             if sym is not None and sym.kind is SymbolKind.ENUM_VARIANT:
@@ -248,8 +253,9 @@ class ExpressionTypeChecker:
     def _lookup_local(self, name: str) -> Optional[Type]:
         """Look up a local variable's type in the scope stack."""
         for scope in reversed(self._local_scopes):
-            if name in scope:
-                return scope[name]
+            typ = scope.get(name)
+            if typ is not None:
+                return typ
         return None
 
     def _lookup_local_scope_index(self, name: str) -> Optional[int]:
@@ -303,8 +309,9 @@ class ExpressionTypeChecker:
     def _lookup_alive(self, name: str) -> Optional[bool]:
         """Check if a variable is currently alive (not dropped)."""
         for scope in reversed(self._alive_scopes):
-            if name in scope:
-                return scope[name]
+            alive = scope.get(name)
+            if alive is not None:
+                return alive
         return None
 
     def _set_alive(self, name: str, alive: bool) -> None:
@@ -724,22 +731,38 @@ class ExpressionTypeChecker:
                 self._error(stmt, f"[TYP-0103] no type information for enum '{format_type(scrutinee_ty)}'")
                 return None
 
-            # check that all variants are covered (or wildcard present)
-            arm_variants = set(arm.pattern.name for arm in stmt.arms if isinstance(arm.pattern, VariantPattern))
-            is_wildcard_present = any(isinstance(arm.pattern, WildcardPattern) for arm in stmt.arms)
+            # check that all variants are covered (or wildcard present), tracking
+            # covered variants as a bitmask over declaration ordinals.
+            # `unknown_variants` exists only to keep the pre-bitmask counting, which
+            # (like Stage 2) adds unknown names to the covered count. That count is
+            # wrong: `On() | Maybe() | _` over `On | Off` warns TYP-0105 although
+            # `Off` is uncovered. Kept as is here; the miscount is a separate bug.
+            variant_bits = {name: 1 << ordinal for ordinal, name in enumerate(enum_info.variants)}
+            all_variants_mask = (1 << len(variant_bits)) - 1
+            covered_mask = 0
+            unknown_variants: Set[str] = set()
+            is_wildcard_present = False
+            for arm in stmt.arms:
+                if isinstance(arm.pattern, VariantPattern):
+                    bit = variant_bits.get(arm.pattern.name)
+                    if bit is None:
+                        unknown_variants.add(arm.pattern.name)
+                    else:
+                        covered_mask |= bit
+                elif isinstance(arm.pattern, WildcardPattern):
+                    is_wildcard_present = True
             is_exhaustive = is_wildcard_present
             if not is_wildcard_present:
-                defined_variants = set(enum_info.variants.keys())
-                if arm_variants == defined_variants:
+                if covered_mask == all_variants_mask and not unknown_variants:
                     is_exhaustive = True
                 else:
-                    missing_variants = defined_variants - arm_variants
+                    missing_variants = {name for name, bit in variant_bits.items() if not covered_mask & bit}
                     self._error(
                         stmt,
                         f"[TYP-0104] non-exhaustive match: missing variants ("
                         f"{', '.join(missing_variants)}) for enum '{format_type(scrutinee_ty)}'"
                     )
-            elif len(arm_variants) == len(enum_info.variants):
+            elif covered_mask.bit_count() + len(unknown_variants) == len(enum_info.variants):
                 # wildcard is a no-op if all variants are already covered
                 self._warn(stmt,
                            f"[TYP-0105] unreachable wildcard pattern in match: all variants of "
@@ -7,6 +7,8 @@ This module provides the Lexer class for tokenizing L0 source code,
 along with Token definitions and related utilities.
 """
 
+import re
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Optional
@@ -258,6 +260,34 @@ _EXPR_ENDING_TOKENS = frozenset({
     TokenKind.RBRACKET,
 })
 
+# Single-character punctuation that never combines with a following character.
+_SINGLE_CHAR_TOKENS = {
+    "(": TokenKind.LPAREN,
+    ")": TokenKind.RPAREN,
+    "{": TokenKind.LBRACE,
+    "}": TokenKind.RBRACE,
+    "[": TokenKind.LBRACKET,
+    "]": TokenKind.RBRACKET,
+    ",": TokenKind.COMMA,
+    ";": TokenKind.SEMI,
+    ".": TokenKind.DOT,
+    "?": TokenKind.QUESTION,
+    "^": TokenKind.CARET,
+    "~": TokenKind.TILDE,
+    "+": TokenKind.PLUS,
+    "*": TokenKind.STAR,
+    "/": TokenKind.SLASH,
+    "%": TokenKind.MODULO,
+}
+
+# Precompiled scanners for the hot runs of the source text; matching runs in the C regex engine
+# rather than one `_advance()` call per character.
+_WS_AND_LINE_COMMENTS_RE = re.compile(r"(?:[ \t\r\n]+|//[^\n\0]*)+")
+# `\w` matches exactly `str.isalnum()` characters plus '_', mirroring the identifier rule.
+_IDENT_TAIL_RE = re.compile(r"\w*")
+# Integer literals use ASCII digits only, as in Stage 2; `\d` would also accept other Unicode digits.
+_DIGITS_RE = re.compile(r"[0-9]*")
+
 # Constants for escape sequence validation
 OCT_CHARS = "01234567"
 HEX_CHARS = "0123456789abcdefABCDEF"
@@ -338,6 +368,21 @@ class Lexer:
                 self.column += 1
         return c
 
+    def _advance_to(self, end: int) -> str:
+        """Advance the current index to `end` and return the consumed text.
+
+        Line and column tracking match a sequence of `_advance()` calls over the same text.
+        """
+        text = self.source[self.index:end]
+        self.index = end
+        newlines = text.count("\n")
+        if newlines:
+            self.line += newlines
+            self.column = len(text) - text.rfind("\n")
+        else:
+            self.column += len(text)
+        return text
+
     # --- main API ---
 
     def tokenize(self) -> List[Token]:
@@ -368,10 +413,9 @@ class Lexer:
 
         # identifiers / keywords and underscore wildcard
         if c.isalpha() or c == "_":
-            ident = [c]
-            while self._peek().isalnum() or self._peek() == "_":
-                ident.append(self._advance())
-            text = "".join(ident)
+            # Interned so that every symbol-table key and lookup for a name
+            # shares one string object and dict probes compare by identity.
+            text = sys.intern(c + self._advance_to(_IDENT_TAIL_RE.match(self.source, self.index).end()))
             if text == "_":
                 kind = TokenKind.UNDERSCORE
             else:
@@ -379,7 +423,7 @@ class Lexer:
             return Token(kind, text, start_line, start_col)
 
         # numbers (only integers for now)
-        if c.isdigit():
+        if "0" <= c <= "9":
             text = self._read_number(c, start_col, start_line)
             return Token(TokenKind.INT, text, start_line, start_col)
 
@@ -395,40 +439,24 @@ class Lexer:
 
         # punctuation / operators with lookahead
 
+        kind = _SINGLE_CHAR_TOKENS.get(c)
+        if kind is not None:
+            return Token(kind, c, start_line, start_col)
+
         if c == "-":
             if self._peek() == ">":
                 self._advance()
                 return Token(TokenKind.ARROW_FUNC, "->", start_line, start_col)
-            elif self._peek().isdigit() and self._prev_kind not in _EXPR_ENDING_TOKENS:
+            elif "0" <= self._peek() <= "9" and self._prev_kind not in _EXPR_ENDING_TOKENS:
                 text = self._read_number(self._advance(), start_col, start_line, is_negative=True)
                 return Token(TokenKind.INT, text, start_line, start_col)
             return Token(TokenKind.MINUS, c, start_line, start_col)
 
-        if c == "(":
-            return Token(TokenKind.LPAREN, c, start_line, start_col)
-        if c == ")":
-            return Token(TokenKind.RPAREN, c, start_line, start_col)
-        if c == "{":
-            return Token(TokenKind.LBRACE, c, start_line, start_col)
-        if c == "}":
-            return Token(TokenKind.RBRACE, c, start_line, start_col)
-        if c == "[":
-            return Token(TokenKind.LBRACKET, c, start_line, start_col)
-        if c == "]":
-            return Token(TokenKind.RBRACKET, c, start_line, start_col)
-        if c == ",":
-            return Token(TokenKind.COMMA, c, start_line, start_col)
-        if c == ";":
-            return Token(TokenKind.SEMI, c, start_line, start_col)
         if c == ":":
             if self._peek() == ":":
                 self._advance()
                 return Token(TokenKind.DOUBLE_COLON, "::", start_line, start_col)
             return Token(TokenKind.COLON, c, start_line, start_col)
-        if c == ".":
-            return Token(TokenKind.DOT, c, start_line, start_col)
-        if c == "?":
-            return Token(TokenKind.QUESTION, c, start_line, start_col)
 
         if c == "=":
             nxt = self._peek()
@@ -476,20 +504,6 @@ class Lexer:
                 return Token(TokenKind.OROR, "||", start_line, start_col)
             return Token(TokenKind.PIPE, c, start_line, start_col)
 
-        if c == "^":
-            return Token(TokenKind.CARET, c, start_line, start_col)
-        if c == "~":
-            return Token(TokenKind.TILDE, c, start_line, start_col)
-
-        if c == "+":
-            return Token(TokenKind.PLUS, c, start_line, start_col)
-        if c == "*":
-            return Token(TokenKind.STAR, c, start_line, start_col)
-        if c == "/":
-            return Token(TokenKind.SLASH, c, start_line, start_col)
-        if c == "%":
-            return Token(TokenKind.MODULO, c, start_line, start_col)
-
         self._error(f"[LEX-0040] unexpected character {c!r} at {start_line}:{start_col}", start_line, start_col)
         return self._next_token()
 
@@ -626,10 +640,7 @@ class Lexer:
 
     def _read_number(self, c: str, start_col: int, start_line: int, is_negative: bool = False) -> str:
         """Scan an integer literal."""
-        digits = [c]
-        while self._peek().isdigit():
-            digits.append(self._advance())
-        text = "".join(digits)
+        text = c + self._advance_to(_DIGITS_RE.match(self.source, self.index).end())
         if is_negative:
             text = "-" + text
         if self._peek().isalpha() or self._peek() == "_":
@@ -643,30 +654,18 @@ class Lexer:
 
     def _skip_ws_and_comments(self) -> None:
         """Skip whitespace and both line and block comments."""
+        source = self.source
         while True:
-            c = self._peek()
-            if c in (" ", "\t", "\r", "\n"):
-                self._advance()
-                continue
-            if c == "/" and self._peek_next() == "/":
-                # line comment
-                self._advance()  # '/'
-                self._advance()  # second '/'
-                while self._peek() not in ("\n", "\0"):
-                    self._advance()
-                continue
-            if c == "/" and self._peek_next() == "*":
-                # block comment
-                self._advance()  # '/'
-                self._advance()  # '*'
-                while True:
-                    if self._at_end():
-                        self._error("[LEX-0070] unterminated block comment", self.line, self.column)
-                        break
-                    if self._peek() == "*" and self._peek_next() == "/":
-                        self._advance()  # '*'
-                        self._advance()  # '/'
-                        break
-                    self._advance()
-                continue
-            break
+            # whitespace and line comments
+            run = _WS_AND_LINE_COMMENTS_RE.match(source, self.index)
+            if run is not None:
+                self._advance_to(run.end())
+            if not source.startswith("/*", self.index):
+                break
+            # block comment
+            close = source.find("*/", self.index + 2)
+            if close < 0:
+                self._advance_to(self.length)
+                self._error("[LEX-0070] unterminated block comment", self.line, self.column)
+                break
+            self._advance_to(close + 2)
@@ -307,8 +307,9 @@ class LocalScopeResolver:
             decl: Node,
     ) -> LocalSymbol:
         """Declare a local symbol in the given scope."""
-        if name in scope.symbols:
-            return scope.symbols[name]
+        sym = scope.symbols.get(name)
+        if sym is not None:
+            return sym
         sym = LocalSymbol(name=name, kind=kind, type_ref=type_ref, decl=decl)
         scope.symbols[name] = sym
         return sym
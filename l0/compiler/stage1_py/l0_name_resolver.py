@@ -184,8 +184,8 @@ class NameResolver:
 
             for name, sym in imported_env.locals.items():
                 # Local definition wins
-                if name in env.locals:
-                    local_sym = env.locals[name]
+                local_sym = env.locals.get(name)
+                if local_sym is not None:
 
                     # Special-case: extern function prototypes
                     if self._extern_signatures_compatible(local_sym, sym):
@@ -221,8 +221,9 @@ class NameResolver:
                     continue
 
                 # Name already imported from another module -> ambiguous, will need disambiguation later
-                if name in env.imported and env.imported[name] is not sym:
-                    prev_module = env.imported[name].module.name
+                prev_sym = env.imported.get(name)
+                if prev_sym is not None and prev_sym is not sym:
+                    prev_module = prev_sym.module.name
                     env.diagnostics.append(
                         diag_from_node(
                             kind="warning",
@@ -239,13 +240,14 @@ class NameResolver:
                         )
                     )
                     # Remove from visible set; name becomes unusable
-                    if name in env.all and env.all[name] is env.imported[name]:
+                    if env.all.get(name) is prev_sym:
                         del env.all[name]
                     # Track ambiguous names for better diagnostics later
-                    if name not in env.ambiguous_imports:
+                    ambiguous_modules = env.ambiguous_imports.get(name)
+                    if ambiguous_modules is None:
                         env.ambiguous_imports[name] = [prev_module, imported_mod_name]
                     else:
-                        env.ambiguous_imports[name].append(imported_mod_name)
+                        ambiguous_modules.append(imported_mod_name)
                     # Keep the first imported symbol in env.imported as bookkeeping,
                     # but resolution will consult env.all only.
                     continue
@@ -253,8 +255,7 @@ class NameResolver:
                 # Fresh imported name
                 env.imported[name] = sym
                 # Only add to env.all if not already present (locals already handled)
-                if name not in env.all:
-                    env.all[name] = sym
+                env.all.setdefault(name, sym)
 
     def _extern_signatures_compatible(self, local: Symbol, imported: Symbol) -> bool:
         """Check if two extern function signatures are compatible."""
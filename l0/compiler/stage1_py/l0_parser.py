@@ -7,8 +7,9 @@ This module provides the Parser class for recursive descent parsing of L0 tokens
 into an abstract syntax tree (AST).
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, NoReturn
+from typing import Callable, Dict, List, Optional, NoReturn
 
 from l0_ast import (
     Span, TypeRef, Import, TopLevelDecl, Param, FuncDecl, FieldDecl, StructDecl, EnumVariant, EnumDecl,
@@ -274,7 +275,7 @@ class Parser:
             mod_parts = self._get_dotted_module_name(first_mod)
 
             self._expect_semicolon("[PAR-0312] expected ';' after module name")
-            module_name = ".".join(mod_parts)
+            module_name = sys.intern(".".join(mod_parts))
 
             imports: List[Import] = []
             while self._match(TokenKind.IMPORT):
@@ -282,7 +283,7 @@ class Parser:
                 parts = self._get_dotted_module_name(first)
 
                 self._expect_semicolon("[PAR-0321] expected ';' after import")
-                imports.append(Import(".".join(parts)))
+                imports.append(Import(sys.intern(".".join(parts))))
         except _ParseSyncException:
             # Failed to parse module header. Return an empty module to allow driver to collect errors.
             return Module("unknown", [], [], span=self._extend_span(start), filename=filename)
@@ -310,26 +311,18 @@ class Parser:
 
     def _parse_top_level_decl(self) -> TopLevelDecl:
         """Parse a single top-level declaration."""
-        if self._check(TokenKind.EXTERN):
-            return self._parse_extern_func()
-        if self._check(TokenKind.FUNC):
-            return self._parse_function(is_extern=False)
-        if self._check(TokenKind.STRUCT):
-            return self._parse_struct()
-        if self._check(TokenKind.ENUM):
-            return self._parse_enum()
-        if self._check(TokenKind.TYPE):
-            return self._parse_type_alias()
-        if self._check(TokenKind.LET):
-            return self._parse_top_level_let()
-        self._error_unexpected("[PAR-0020]", self._peek(), "top level declaration");
+        tok = self._peek()
+        parse_decl = self._TOP_LEVEL_PARSERS.get(tok.kind)
+        if parse_decl is None:
+            self._error_unexpected("[PAR-0020]", tok, "top level declaration")
+        return parse_decl(self)
 
     def _parse_extern_func(self) -> FuncDecl:
         """Parse an 'extern' function declaration."""
         self._expect(TokenKind.EXTERN, "[PAR-0030] expected 'extern'")
         return self._parse_function(is_extern=True)
 
-    def _parse_function(self, is_extern: bool) -> FuncDecl:
+    def _parse_function(self, is_extern: bool = False) -> FuncDecl:
         """Parse a function declaration or definition."""
         start = self._span_start()
         self._expect(TokenKind.FUNC, "[PAR-0040] expected 'func'")
@@ -487,20 +480,9 @@ class Parser:
 
     def _parse_stmt(self) -> Stmt:
         """Parse a single statement."""
-        if self._check(TokenKind.LBRACE):
-            return self._parse_block()
-        elif self._check(TokenKind.IF):
-            return self._parse_if_stmt()
-        elif self._check(TokenKind.MATCH):
-            return self._parse_match_stmt()
-        elif self._check(TokenKind.CASE):
-            return self._parse_case_stmt()
-        elif self._check(TokenKind.WHILE):
-            return self._parse_while_stmt()
-        elif self._check(TokenKind.FOR):
-            return self._parse_for_stmt()
-        elif self._check(TokenKind.WITH):
-            return self._parse_with_stmt()
+        parse_compound = self._COMPOUND_STMT_PARSERS.get(self._peek().kind)
+        if parse_compound is not None:
+            return parse_compound(self)
 
         simple_stmt = self._parse_simple_stmt()
 
@@ -510,28 +492,17 @@ class Parser:
 
     def _parse_simple_stmt(self) -> Stmt:
         """Parse a simple statement (let, break, return, assign, or expr)."""
-        start = self._span_start()
-
-        if self._check(TokenKind.LET):
-            simple_stmt = self._parse_let_stmt()
-        elif self._check(TokenKind.BREAK):
-            simple_stmt = self._parse_break_stmt()
-        elif self._check(TokenKind.CONTINUE):
-            simple_stmt = self._parse_continue_stmt()
-        elif self._check(TokenKind.RETURN):
-            simple_stmt = self._parse_return_stmt()
-        elif self._check(TokenKind.DROP):
-            simple_stmt = self._parse_drop_stmt()
-        else:
-            # otherwise: either assignment or expr-stmt
-            expr = self._parse_expr()
-            if self._match(TokenKind.EQ):
-                value = self._parse_expr()
-                simple_stmt = AssignStmt(expr, value, span=self._extend_span(start))
-            else:
-                simple_stmt = ExprStmt(expr, span=self._extend_span(start))
+        parse_keyword_stmt = self._KEYWORD_SIMPLE_STMT_PARSERS.get(self._peek().kind)
+        if parse_keyword_stmt is not None:
+            return parse_keyword_stmt(self)
 
-        return simple_stmt
+        # otherwise: either assignment or expr-stmt
+        start = self._span_start()
+        expr = self._parse_expr()
+        if self._match(TokenKind.EQ):
+            value = self._parse_expr()
+            return AssignStmt(expr, value, span=self._extend_span(start))
+        return ExprStmt(expr, span=self._extend_span(start))
 
     def _parse_let_stmt(self) -> LetStmt:
         """Parse a local 'let' statement."""
@@ -991,39 +962,18 @@ class Parser:
         return has_suffix and at_boundary
 
     def _parse_primary_expr(self) -> Expr:
-        """Parse a primary expression (literals, identifiers, parenthesized expressions)."""
+        """Parse a primary expression (literals, identifiers, parenthesized expressions).
+
+        Note:
+            Identifiers are checked first, then string/int/null literals, then the rest, so the most common
+            primary expressions resolve after one or two kind comparisons.
+        """
         start = self._span_start()
         tok = self._peek()
-
-        # 'new' constructor
-        if self._match(TokenKind.NEW):
-            type_ref = self._parse_type()
-            args: List[Expr] = []
-            if self._match(TokenKind.LPAREN):
-                if not self._check(TokenKind.RPAREN):
-                    while True:
-                        args.append(self._parse_call_argument())
-                        if not self._match(TokenKind.COMMA):
-                            break
-                self._expect(TokenKind.RPAREN, "[PAR-0223] expected ')' after arguments to 'new'")
-            return NewExpr(type_ref, args, span=self._extend_span(start))
-
-        # Literals
-        if self._match(TokenKind.INT):
-            return IntLiteral(int(tok.text), span=self._extend_span(start))
-        if self._match(TokenKind.BYTE):
-            return ByteLiteral(tok.text, span=self._extend_span(start))
-        if self._match(TokenKind.STRING):
-            return StringLiteral(tok.text, span=self._extend_span(start))
-        if self._match(TokenKind.TRUE):
-            return BoolLiteral(True, span=self._extend_span(start))
-        if self._match(TokenKind.FALSE):
-            return BoolLiteral(False, span=self._extend_span(start))
-        if self._match(TokenKind.NULL):
-            return NullLiteral(span=self._extend_span(start))
+        kind = tok.kind
 
         # Identifier (variable reference, or ambiguous type name resolved later)
-        if self._check(TokenKind.IDENT):
+        if kind is TokenKind.IDENT:
             qualified = self._try_parse_qualified_name()
             if qualified is not None:
                 module_path, name_qualifier, name_tok = qualified
@@ -1032,10 +982,74 @@ class Parser:
             name_tok = self._advance()
             return VarRef(name_tok.text, span=self._extend_span(start))
 
+        # Literals
+        if kind is TokenKind.STRING:
+            self._advance()
+            return StringLiteral(tok.text, span=self._extend_span(start))
+        if kind is TokenKind.INT:
+            self._advance()
+            return IntLiteral(int(tok.text), span=self._extend_span(start))
+        if kind is TokenKind.NULL:
+            self._advance()
+            return NullLiteral(span=self._extend_span(start))
+
         # Parenthesized expression
-        if self._match(TokenKind.LPAREN):
+        if kind is TokenKind.LPAREN:
+            self._advance()
             inner = self._parse_expr()
             self._expect(TokenKind.RPAREN, "[PAR-0224] expected ')' after expression")
             return ParenExpr(inner, span=self._extend_span(start))
 
+        if kind is TokenKind.TRUE or kind is TokenKind.FALSE:
+            self._advance()
+            return BoolLiteral(kind is TokenKind.TRUE, span=self._extend_span(start))
+        if kind is TokenKind.BYTE:
+            self._advance()
+            return ByteLiteral(tok.text, span=self._extend_span(start))
+
+        # 'new' constructor
+        if kind is TokenKind.NEW:
+            self._advance()
+            type_ref = self._parse_type()
+            args: List[Expr] = []
+            if self._match(TokenKind.LPAREN):
+                if not self._check(TokenKind.RPAREN):
+                    while True:
+                        args.append(self._parse_call_argument())
+                        if not self._match(TokenKind.COMMA):
+                            break
+                self._expect(TokenKind.RPAREN, "[PAR-0223] expected ')' after arguments to 'new'")
+            return NewExpr(type_ref, args, span=self._extend_span(start))
+
         self._error_unexpected("[PAR-0225]", tok, "expression")
+
+    # --- keyword dispatch tables ---
+
+    # Keyed by the kind of the token that starts the construct; values are unbound methods,
+    # so each dispatch is a single dict probe instead of a chain of `_check` calls.
+    _TOP_LEVEL_PARSERS: Dict[TokenKind, Callable[["Parser"], TopLevelDecl]] = {
+        TokenKind.EXTERN: _parse_extern_func,
+        TokenKind.FUNC: _parse_function,
+        TokenKind.STRUCT: _parse_struct,
+        TokenKind.ENUM: _parse_enum,
+        TokenKind.TYPE: _parse_type_alias,
+        TokenKind.LET: _parse_top_level_let,
+    }
+
+    _COMPOUND_STMT_PARSERS: Dict[TokenKind, Callable[["Parser"], Stmt]] = {
+        TokenKind.LBRACE: _parse_block,
+        TokenKind.IF: _parse_if_stmt,
+        TokenKind.MATCH: _parse_match_stmt,
+        TokenKind.CASE: _parse_case_stmt,
+        TokenKind.WHILE: _parse_while_stmt,
+        TokenKind.FOR: _parse_for_stmt,
+        TokenKind.WITH: _parse_with_stmt,
+    }
+
+    _KEYWORD_SIMPLE_STMT_PARSERS: Dict[TokenKind, Callable[["Parser"], Stmt]] = {
+        TokenKind.LET: _parse_let_stmt,
+        TokenKind.BREAK: _parse_break_stmt,
+        TokenKind.CONTINUE: _parse_continue_stmt,
+        TokenKind.RETURN: _parse_return_stmt,
+        TokenKind.DROP: _parse_drop_stmt,
+    }
@@ -128,10 +128,10 @@ def resolve_symbol(
     sym = env.locals.get(name) if module_path else env.all.get(name)
     if sym is None:
         # For unqualified lookups, check if the name is ambiguous
-        if not module_path and name in env.ambiguous_imports:
-            modules = tuple(env.ambiguous_imports[name])
+        ambiguous_modules = None if module_path else env.ambiguous_imports.get(name)
+        if ambiguous_modules is not None:
             return SymbolResolution(None, ResolveErrorKind.AMBIGUOUS_SYMBOL,
-                                    module_name, name, ambiguous_modules=modules)
+                                    module_name, name, ambiguous_modules=tuple(ambiguous_modules))
         return SymbolResolution(None, ResolveErrorKind.UNKNOWN_SYMBOL, module_name, name)
 
     return SymbolResolution(sym, None, module_name, name)
@@ -7,6 +7,7 @@ This module provides the SignatureResolver class which resolves types for
 function parameters, return values, struct fields, enum payloads, and type aliases.
 """
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -60,9 +61,12 @@ class EnumVariantInfo:
     Attributes:
         name: The name of the variant.
         field_types: List of resolved types for the variant's payload fields.
+        decl: The EnumVariant AST node declaring the variant, kept so that code
+            generation can recover payload field names without rescanning the module.
     """
     name: str
     field_types: List[Type]
+    decl: Optional[EnumVariant] = None
 
 
 @dataclass
@@ -117,6 +121,11 @@ class SignatureResolver:
         self.enum_infos: Dict[Tuple[str, str], EnumInfo] = {}
         self.let_types: Dict[Tuple[str, str], Type] = {}
 
+        # Value-type dependencies of each struct and enum, recorded while
+        # resolving their fields and consumed by cycle detection.
+        self._struct_value_deps: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self._enum_value_deps: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+
     def resolve(self) -> None:
         """Resolve all top-level signatures in the compilation unit.
 
@@ -341,6 +350,7 @@ class SignatureResolver:
         struct_sym.type = struct_ty
 
         fields_info: List[StructFieldInfo] = []
+        deps: Set[Tuple[str, str]] = set()
 
         for field in decl.fields:
             assert isinstance(field, FieldDecl)
@@ -349,9 +359,11 @@ class SignatureResolver:
                 # error already emitted
                 continue
             fields_info.append(StructFieldInfo(name=field.name, type=ftype))
+            deps.update(self._extract_value_type_dependencies(ftype))
 
         key = (env.name, decl.name)
         self.struct_infos[key] = StructInfo(struct_type=struct_ty, fields=fields_info)
+        self._struct_value_deps[key] = deps
 
     def _resolve_enum(self, env: ModuleEnv, decl: EnumDecl) -> None:
         """Resolve variant payload types for an enum declaration."""
@@ -363,6 +375,7 @@ class SignatureResolver:
         enum_sym.type = enum_ty
 
         variant_infos: Dict[str, EnumVariantInfo] = {}
+        deps: Set[Tuple[str, str]] = set()
 
         for variant in decl.variants:
             assert isinstance(variant, EnumVariant)
@@ -373,12 +386,14 @@ class SignatureResolver:
                 if ftype is None:
                     continue
                 field_types.append(ftype)
+                deps.update(self._extract_value_type_dependencies(ftype))
             variant_infos[variant.name] = EnumVariantInfo(
-                name=variant.name, field_types=field_types
+                name=variant.name, field_types=field_types, decl=variant
             )
 
         key = (env.name, decl.name)
         self.enum_infos[key] = EnumInfo(enum_type=enum_ty, variants=variant_infos)
+        self._enum_value_deps[key] = deps
 
         # Also annotate enum-variant symbols with their (tuple) payload type
         for variant in decl.variants:
@@ -554,59 +569,43 @@ class SignatureResolver:
         infinite-size types and are prohibited. Pointers must be used to
         break such cycles.
         """
-        # dependency graph maps (module, type) to the set of (module, type) it depends on for value fields
-        graph: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
-
-        # Process all structs
-        for (mod_name, struct_name), struct_info in self.struct_infos.items():
-            key = (mod_name, struct_name)
-            deps = set()
-
-            for field in struct_info.fields:
-                field_deps = self._extract_value_type_dependencies(field.type)
-                deps.update(field_deps)
-
-            graph[key] = deps
-
-        # Process all enums
-        for (mod_name, enum_name), enum_info in self.enum_infos.items():
-            key = (mod_name, enum_name)
-            deps = set()
-
-            for variant_info in enum_info.variants.values():
-                for field_type in variant_info.field_types:
-                    field_deps = self._extract_value_type_dependencies(field_type)
-                    deps.update(field_deps)
-
-            graph[key] = deps
+        # dependency graph maps (module, type) to the set of (module, type) it depends on for value fields;
+        # the edges were collected while resolving each struct and enum
+        graph: Dict[Tuple[str, str], Set[Tuple[str, str]]] = dict(self._struct_value_deps)
+        graph.update(self._enum_value_deps)
+
+        # Reverse edges: for each type, the types whose values contain it
+        dependents: Dict[Tuple[str, str], List[Tuple[str, str]]] = {node: [] for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                if dep in dependents:
+                    dependents[dep].append(node)
 
         # Perform topological sort to detect cycles
-        from collections import deque
-
         in_degree = {node: len(graph[node]) for node in graph}
         queue = deque([node for node, degree in in_degree.items() if degree == 0])
-        processed = []
+        processed: Set[Tuple[str, str]] = set()
 
         while queue:
             node = queue.popleft()
-            processed.append(node)
+            processed.add(node)
 
             # Reduce in-degree of dependents
-            for dependent in graph:
-                if node in graph[dependent]:
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        queue.append(dependent)
+            for dependent in dependents[node]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
 
         # Check for cycles
         if len(processed) != len(graph):
             # Find nodes involved in cycle
             unresolved = [node for node in graph if node not in processed]
+            unresolved_set = set(unresolved)
 
             # Format cycle details for error message
             cycle_parts = []
             for node in unresolved[:3]:  # Limit to first 3 for readability
-                deps = [f"{m}::{n}" for m, n in graph.get(node, set()) if (m, n) in unresolved]
+                deps = [f"{m}::{n}" for m, n in graph.get(node, set()) if (m, n) in unresolved_set]
                 node_str = f"{node[0]}::{node[1]}"
                 if deps:
                     cycle_parts.append(f"{node_str} depends on {', '.join(deps)}")
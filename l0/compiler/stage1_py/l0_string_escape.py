@@ -8,24 +8,58 @@ sequences preserved) into raw bytes, and encoding raw bytes into C-compatible
 string literal bodies.
 """
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 _HEX_CHARS = "0123456789abcdefABCDEF"
 _OCT_CHARS = "01234567"
 _SIMPLE_ESCAPES = {
-    "\\": ord("\\"),
-    "'": ord("'"),
-    '"': ord('"'),
-    "?": ord("?"),
-    "a": 0x07,
-    "b": 0x08,
-    "f": 0x0C,
-    "n": 0x0A,
-    "r": 0x0D,
-    "t": 0x09,
-    "v": 0x0B,
+    "\\": b"\\",
+    "'": b"'",
+    '"': b'"',
+    "?": b"?",
+    "a": b"\x07",
+    "b": b"\x08",
+    "f": b"\x0c",
+    "n": b"\n",
+    "r": b"\r",
+    "t": b"\t",
+    "v": b"\x0b",
 }
+# One escape sequence, without its leading backslash: hex (any number of
+# digits), \u / \U (fixed width, validated by the handler), octal (up to
+# three digits), any other single character, or a trailing lone backslash.
+_ESCAPE_RE = re.compile(r"\\(x[0-9a-fA-F]*|u.{0,4}|U.{0,8}|[0-7]{1,3}|.|\Z)", re.DOTALL)
+
+
+def _c_byte_encoding(b: int) -> str:
+    """Return the C string literal spelling of a single byte."""
+    if b == 0x5C:  # backslash
+        return "\\\\"
+    if b == 0x22:  # quote
+        return '\\"'
+    if b == 0x0A:
+        return "\\n"
+    if b == 0x09:
+        return "\\t"
+    if b == 0x0D:
+        return "\\r"
+    if b == 0x08:
+        return "\\b"
+    if b == 0x0C:
+        return "\\f"
+    if b == 0x0B:
+        return "\\v"
+    if 0x20 <= b <= 0x7E:
+        return chr(b)
+    # Use fixed-width octal escape to avoid \x run-on in C string literals.
+    return f"\\{b:03o}"
+
+
+# C spelling of every byte value, indexed by byte.
+_C_BYTE_ENCODINGS = tuple(_c_byte_encoding(b) for b in range(256))
 
 
 @dataclass(frozen=True)
@@ -40,10 +74,13 @@ class EscapeDecodeError(ValueError):
     details: str = ""
 
 
+@lru_cache(maxsize=4096)
 def decode_l0_string_token(text: str) -> bytes:
     """Decode an L0 string literal payload to raw bytes.
 
     Processes C-style escape sequences including hex, octal, and Unicode.
+    Results are memoized: the type checker and the C emitter both decode
+    every literal, and programs repeat the same literals.
 
     Args:
         text: The string literal content (without surrounding quotes).
@@ -54,78 +91,64 @@ def decode_l0_string_token(text: str) -> bytes:
     Raises:
         EscapeDecodeError: If a malformed Unicode escape is encountered.
     """
-    out = bytearray()
-    i = 0
-
-    while i < len(text):
-        ch = text[i]
-        if ch != "\\":
-            out.extend(ch.encode("utf-8"))
-            i += 1
-            continue
-
-        i += 1
-        if i >= len(text):
-            out.append(ord("\\"))
-            break
-
-        esc = text[i]
-
-        if esc in _SIMPLE_ESCAPES:
-            out.append(_SIMPLE_ESCAPES[esc])
-            i += 1
-            continue
-
-        if esc == "x":
-            i += 1
-            start = i
-            while i < len(text) and text[i] in _HEX_CHARS:
-                i += 1
-            hex_digits = text[start:i]
-            if not hex_digits:
-                out.extend(b"x") # would have been rejected by the lexer, but be lenient here and preserve the 'x' as-is
-                continue
-            out.append(int(hex_digits, 16) & 0xFF)
-            continue
-
-        if esc == "u":
-            digits = text[i + 1:i + 5]
-            if len(digits) != 4 or any(c not in _HEX_CHARS for c in digits):
-                raise EscapeDecodeError("invalid_unicode_escape", "\\u")
-            value = int(digits, 16)
-            if value > 0x10FFFF:
-                raise EscapeDecodeError("unicode_out_of_range", "\\u")
-            out.extend(chr(value).encode("utf-8"))
-            i += 5
-            continue
-
-        if esc == "U":
-            digits = text[i + 1:i + 9]
-            if len(digits) != 8 or any(c not in _HEX_CHARS for c in digits):
-                raise EscapeDecodeError("invalid_unicode_escape", "\\U")
-            value = int(digits, 16)
-            if value > 0x10FFFF:
-                raise EscapeDecodeError("unicode_out_of_range", "\\U")
-            out.extend(chr(value).encode("utf-8"))
-            i += 9
-            continue
-
-        if esc in _OCT_CHARS:
-            start = i
-            i += 1
-            while i < len(text) and text[i] in _OCT_CHARS and i - start < 3:
-                i += 1
-            oct_digits = text[start:i]
-            out.append(int(oct_digits, 8) & 0xFF)
-            continue
-
-        # Unknown escapes: be lenient and preserve as-is
-        out.extend(esc.encode("utf-8"))
-        i += 1
+    if "\\" not in text:
+        return text.encode("utf-8")
 
+    out = bytearray()
+    pos = 0
+    for match in _ESCAPE_RE.finditer(text):
+        out += text[pos:match.start()].encode("utf-8")
+        out += _decode_escape(match.group(1))
+        pos = match.end()
+    out += text[pos:].encode("utf-8")
     return bytes(out)
 
 
+def _decode_escape(body: str) -> bytes:
+    """Decode a single escape sequence matched by `_ESCAPE_RE`.
+
+    Args:
+        body: The escape sequence without its leading backslash.
+
+    Returns:
+        The bytes the escape sequence stands for.
+
+    Raises:
+        EscapeDecodeError: If a malformed Unicode escape is encountered.
+    """
+    simple = _SIMPLE_ESCAPES.get(body)
+    if simple is not None:
+        return simple
+
+    if not body:
+        # Trailing lone backslash: preserve it
+        return b"\\"
+
+    lead = body[0]
+
+    if lead == "x":
+        if len(body) == 1:
+            return b"x"  # would have been rejected by the lexer, but be lenient here and preserve the 'x' as-is
+        return bytes((int(body[1:], 16) & 0xFF,))
+
+    if lead == "u" or lead == "U":
+        digits = body[1:]
+        width = 4 if lead == "u" else 8
+        if len(digits) != width or any(c not in _HEX_CHARS for c in digits):
+            raise EscapeDecodeError("invalid_unicode_escape", f"\\{lead}")
+        value = int(digits, 16)
+        if value > 0x10FFFF:
+            raise EscapeDecodeError("unicode_out_of_range", f"\\{lead}")
+        return chr(value).encode("utf-8")
+
+    if lead in _OCT_CHARS:
+        return bytes((int(body, 8) & 0xFF,))
+
+    # Unknown escapes: be lenient and preserve as-is
+    return body.encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
 def encode_c_string_bytes(data: bytes) -> str:
     """Encode raw bytes into a C-safe string literal body.
 
@@ -138,27 +161,4 @@ def encode_c_string_bytes(data: bytes) -> str:
     Returns:
         A string containing the encoded C literal content (without quotes).
     """
-    parts: list[str] = []
-    for b in data:
-        if b == 0x5C:  # backslash
-            parts.append("\\\\")
-        elif b == 0x22:  # quote
-            parts.append('\\"')
-        elif b == 0x0A:
-            parts.append("\\n")
-        elif b == 0x09:
-            parts.append("\\t")
-        elif b == 0x0D:
-            parts.append("\\r")
-        elif b == 0x08:
-            parts.append("\\b")
-        elif b == 0x0C:
-            parts.append("\\f")
-        elif b == 0x0B:
-            parts.append("\\v")
-        elif 0x20 <= b <= 0x7E:
-            parts.append(chr(b))
-        else:
-            # Use fixed-width octal escape to avoid \x run-on in C string literals.
-            parts.append(f"\\{b:03o}")
-    return "".join(parts)
+    return "".join(map(_C_BYTE_ENCODINGS.__getitem__, data))
@@ -112,9 +112,10 @@ def get_builtin_type(name: str) -> BuiltinType:
     Returns:
         The cached or new BuiltinType instance.
     """
-    if name not in _BUILTIN_CACHE:
-        _BUILTIN_CACHE[name] = BuiltinType(name)
-    return _BUILTIN_CACHE[name]
+    ty = _BUILTIN_CACHE.get(name)
+    if ty is None:
+        ty = _BUILTIN_CACHE[name] = BuiltinType(name)
+    return ty
 
 
 def get_null_type() -> NullType:
@@ -20,7 +20,9 @@ sys.path.insert(0, str(STAGE1_ROOT))
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(1, str(REPO_ROOT))
 
-from l0_driver import L0Driver
+from l0_ast import Module
+from l0_driver import L0Driver, ParseCache
+from l0_parser import Parser
 from l0_paths import SourceSearchPaths
 
 import shutil
@@ -309,6 +311,49 @@ def search_paths(temp_project: Path, stage1_root: Path) -> SourceSearchPaths:
     return paths
 
 
+@pytest.fixture(scope="session")
+def parse_cache() -> ParseCache:
+    """Fixture providing a parse cache shared by fixture-built drivers.
+
+    Tests write their sources to per-test directories, so in practice only
+    stdlib modules are reused. The cache lives for one session only.
+
+    Returns:
+        An empty parse cache to pass to `L0Driver`.
+    """
+    return {}
+
+
+@pytest.fixture
+def driver_factory(parse_cache: ParseCache):
+    """Fixture providing a factory for drivers rooted at a single project directory.
+
+    Each call returns a fresh L0Driver whose only search root is the given
+    project directory, so module caches and diagnostics never leak between
+    tests. Unchanged files are parsed once per session through `parse_cache`.
+
+    Example:
+        ```python
+        def test_something(driver_factory, temp_project):
+            driver = driver_factory(temp_project)
+            result = driver.analyze("main")
+        ```
+
+    Args:
+        parse_cache: The session parse cache.
+
+    Returns:
+        A callable that takes a project root path and returns an L0Driver.
+    """
+
+    def _make_driver(project_root: Path) -> L0Driver:
+        paths = SourceSearchPaths()
+        paths.add_project_root(project_root)
+        return L0Driver(search_paths=paths, parse_cache=parse_cache)
+
+    return _make_driver
+
+
 @pytest.fixture
 def codegen_dir() -> Path:
     """Fixture providing the path to the codegen test fixtures directory.
@@ -344,13 +389,14 @@ def compile_and_run(runtime_dir: Path):
         runtime_dir: The path to the L0 C runtime headers.
 
     Returns:
-        A callable that takes a C code string and a working directory path,
-        compiles the code using the configured C compiler, executes the
-        resulting binary, and returns a tuple:
-        (success_boolean, standard_output_string, standard_error_string).
+        A callable that takes a C code string, a working directory path, and an
+        optional expected exit code (default 0), compiles the code using the
+        configured C compiler, executes the resulting binary, and returns a
+        tuple: (success_boolean, standard_output_string, standard_error_string).
+        Success means the binary exited with the expected code.
     """
 
-    def _compile_and_run(c_code: str, work_dir: Path) -> tuple[bool, str, str]:
+    def _compile_and_run(c_code: str, work_dir: Path, expected_exit_code: int = 0) -> tuple[bool, str, str]:
         cc = _find_cc()
         flag_family = _compiler_flag_family(cc)
 
@@ -399,13 +445,42 @@ def compile_and_run(runtime_dir: Path):
             timeout=10,
         )
 
-        return result.returncode == 0, result.stdout, result.stderr
+        return result.returncode == expected_exit_code, result.stdout, result.stderr
 
     return _compile_and_run
 
 
+def _parse_module(src: str) -> Module:
+    """Lex and parse a source string into a Module AST node."""
+    return Parser.from_source(src).parse_module()
+
+
+@pytest.fixture(scope="session")
+def parse_module():
+    """Fixture providing a parser-only helper for AST shape tests.
+
+    The helper does not touch the filesystem or the driver, so one shared
+    callable serves the whole session.
+
+    Example:
+        ```python
+        def test_something(parse_module):
+            mod = parse_module('''
+                module main;
+                func f() -> int { return 42; }
+            ''')
+            assert mod.name == "main"
+        ```
+
+    Returns:
+        A callable that takes a source code string and returns the parsed
+        Module AST node.
+    """
+    return _parse_module
+
+
 @pytest.fixture
-def analyze_single(temp_project: Path, stage1_root: Path):
+def analyze_single(temp_project: Path, stage1_root: Path, parse_cache: ParseCache):
     """Fixture to analyze a single L0 module from a source string.
 
     Automatically handles file creation, search path setup (including the stdlib),
@@ -421,22 +496,34 @@ def analyze_single(temp_project: Path, stage1_root: Path):
             assert not result.has_errors()
         ```
 
+    Pass `stop_after="parse"` for tests that only inspect lexer/parser
+    diagnostics: the entry module is lexed and parsed on its own, imports are
+    not loaded, and no semantic pass runs. The returned result carries a
+    single-module compilation unit.
+
     Args:
         temp_project: The temporary project directory fixture.
         stage1_root: The path to the stage 1 compiler root.
+        parse_cache: The session parse cache.
 
     Returns:
-        A callable that takes a module name and source code string,
-        and returns an AnalysisResult.
+        A callable that takes a module name, source code string, and an
+        optional `stop_after` stage, and returns an AnalysisResult.
     """
 
-    def _analyze(module_name: str, src: str):
+    def _analyze(module_name: str, src: str, stop_after: str | None = None):
+        if stop_after not in (None, "parse"):
+            raise ValueError(f"unsupported stop_after stage: {stop_after!r}")
+
         parts = module_name.split(".")
         file_path = temp_project.joinpath(*parts).with_suffix(".l0")
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(dedent(src), newline="\n")
 
-        driver = L0Driver()
+        driver = L0Driver(parse_cache=parse_cache)
+        if stop_after == "parse":
+            return driver.parse_file(file_path)
+
         driver.search_paths.add_system_root(stage1_root.parent / "shared" / "l0" / "stdlib")
         driver.search_paths.add_project_root(temp_project)
         return driver.analyze(module_name)
@@ -5,7 +5,7 @@ import os
 from typing import Dict, List
 
 from l0_ast import Node
-from l0_diagnostics import Diagnostic, diag_from_node, diag_from_token
+from l0_diagnostics import Diagnostic, diag_from_node, diag_from_token, index_diagnostics_by_code
 from l0_parser import Span, Token, TokenKind
 from l0c import print_diagnostic_with_snippet
 
@@ -118,6 +118,28 @@ def test_diagnostic_format_with_file_and_position(tmp_path):
     assert f"{os.path.basename(str(filename))}:4:2(m): warning: unused variable" in s
 
 
+# -------------------------
+# Diagnostic.code
+# -------------------------
+
+
+def test_diagnostic_code_is_parsed_from_message():
+    assert Diagnostic(kind="error", message="[TYP-0024] unknown type 'T'").code == "TYP-0024"
+    assert Diagnostic(kind="error", message="file: [DRV-0010] not found").code == "DRV-0010"
+    assert Diagnostic(kind="warning", message="no code here").code is None
+
+
+def test_index_diagnostics_by_code_groups_in_order():
+    first = Diagnostic(kind="error", message="[TYP-0230] first")
+    other = Diagnostic(kind="warning", message="[RES-0022] other")
+    second = Diagnostic(kind="error", message="[TYP-0230] second")
+    uncoded = Diagnostic(kind="error", message="plain")
+
+    by_code = index_diagnostics_by_code([first, other, uncoded, second])
+
+    assert by_code == {"TYP-0230": [first, second], "RES-0022": [other]}
+
+
 # -------------------------
 # Snippet + caret printing
 # -------------------------
@@ -47,6 +47,34 @@ def test_driver_load_with_imports(write_l0_file, temp_project):
     assert len(module.decls) == 1
 
 
+def test_driver_parse_file_skips_imports_and_semantic_passes(write_l0_file, temp_project):
+    path = write_l0_file(
+        "parseonly",
+        """
+        module parseonly;
+        import missing.dep;
+
+        func main() -> int { return undefined_name; }
+        """,
+    )
+
+    driver = L0Driver()
+    result = driver.parse_file(path)
+
+    assert not result.has_errors()
+    assert result.cu is not None
+    assert result.cu.entry_module.name == "parseonly"
+    assert list(result.cu.modules) == ["parseonly"]
+    assert result.module_envs == {}
+
+
+def test_driver_parse_file_reports_missing_file(temp_project):
+    result = L0Driver().parse_file(temp_project / "absent.l0")
+
+    assert result.cu is None
+    assert has_error_code(result.diagnostics, "DRV-0010")
+
+
 def test_driver_caches_by_module_name(write_l0_file, temp_project):
     write_l0_file(
         "cache_test",
@@ -72,6 +100,49 @@ def test_driver_caches_by_module_name(write_l0_file, temp_project):
     assert cached.name == module1.name == module2.name
 
 
+def test_parse_cache_is_shared_across_drivers_until_source_changes(write_l0_file, temp_project):
+    path = write_l0_file(
+        "shared",
+        """
+        module shared;
+        func main() -> int { return 0 }
+        """,
+    )
+
+    parse_cache = {}
+    first = L0Driver(parse_cache=parse_cache)
+    module1 = first._load_single_file(path)
+    second = L0Driver(parse_cache=parse_cache)
+    module2 = second._load_single_file(path)
+
+    # The cached parse is reused and its diagnostics are replayed per driver.
+    assert module1 is module2
+    assert first.diagnostics
+    assert second.diagnostics == first.diagnostics
+
+    path.write_text("module shared;\nfunc main() -> int { return 1; }\n", encoding="utf-8")
+    third = L0Driver(parse_cache=parse_cache)
+    module3 = third._load_single_file(path)
+
+    assert module3 is not module1
+    assert third.diagnostics == []
+
+
+def test_drivers_without_parse_cache_reparse(write_l0_file, temp_project):
+    path = write_l0_file(
+        "fresh",
+        """
+        module fresh;
+        func main() -> int { return 0; }
+        """,
+    )
+
+    module1 = L0Driver()._load_single_file(path)
+    module2 = L0Driver()._load_single_file(path)
+
+    assert module1 is not module2
+
+
 def test_driver_accepts_utf8_bom(write_l0_file, temp_project):
     path = write_l0_file(
         "bom.main",
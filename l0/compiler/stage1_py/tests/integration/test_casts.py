@@ -129,7 +129,7 @@ def test_casts_wrong_types(tmp_path):
 
     assert result.has_errors()
     assert len(result.diagnostics) == 3
-    assert len([d for d in result.diagnostics if "TYP-0230" in d.message]) == 3
+    assert len(result.diagnostics_by_code().get("TYP-0230", [])) == 3
 
 def  test_casts_wrong_enum_struct(tmp_path):
     """Test casts involving enums and structs."""
@@ -166,4 +166,4 @@ def  test_casts_wrong_enum_struct(tmp_path):
     assert result.has_errors()
     assert len(result.diagnostics) == 4
 
-    assert len([d for d in result.diagnostics if "TYP-0230" in d.message]) == 4
+    assert len(result.diagnostics_by_code().get("TYP-0230", [])) == 4
@@ -8,7 +8,7 @@ import pytest
 from conftest import has_error_code
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SemanticCase:
     name: str
     doc_ref: str
@@ -16,7 +16,7 @@ class SemanticCase:
     error_code: str | None = None
 
 
-VALID_CASES = [
+VALID_CASES = (
     SemanticCase(
         name="local let inference from literal",
         doc_ref="docs/project_status.md#7-Statement-rules",
@@ -118,9 +118,9 @@ VALID_CASES = [
         }
         """,
     ),
-]
+)
 
-INVALID_CASES = [
+INVALID_CASES = (
     SemanticCase(
         name="top-level let requires annotation for non-literal",
         doc_ref="docs/project_status.md#7-Statement-rules",
@@ -360,7 +360,7 @@ INVALID_CASES = [
         """,
         error_code="TYP-0251",
     ),
-]
+)
 
 
 @pytest.mark.parametrize("case", VALID_CASES, ids=lambda c: f"{c.name} [{c.doc_ref}]")
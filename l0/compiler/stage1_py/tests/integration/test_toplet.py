@@ -8,12 +8,12 @@ type checking, and code generation for module-level let bindings.
 #  SPDX-License-Identifier: MIT OR Apache-2.0
 #  Copyright (c) 2026 gwz
 
-import subprocess
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
+from conftest import _find_cc, has_error_code
 from l0_ast import LetDecl, Module
 from l0_backend import Backend
 from l0_driver import L0Driver
@@ -21,7 +21,6 @@ from l0_lexer import Lexer
 from l0_parser import Parser
 
 STAGE1_ROOT = Path(__file__).resolve().parents[2]
-RUNTIME_PATH = STAGE1_ROOT.parent / "shared" / "runtime"
 STDLIB_PATH = STAGE1_ROOT.parent / "shared" / "l0" / "stdlib"
 
 
@@ -34,19 +33,12 @@ def write_tmp(tmp_path, name: str, src: str):
 
 
 def _check_c_compiler_available():
-    """Check if a C compiler (gcc or clang) is available."""
-    for compiler in ["gcc", "clang", "cc"]:
-        try:
-            subprocess.run(
-                [compiler, "--version"],
-                capture_output=True,
-                check=False,
-                timeout=2,
-            )
-            return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            continue
-    return False
+    """Check if the C compiler used by `compile_and_run` is available."""
+    try:
+        _find_cc()
+    except RuntimeError:
+        return False
+    return True
 
 
 # ============================================================================
@@ -297,9 +289,7 @@ def test_typecheck_toplet_duplicate_error(tmp_path):
     result = driver.analyze("test")
 
     assert result.has_errors()
-    # Check that there's an error about duplicate declaration
-    error_messages = [str(d) for d in result.diagnostics]
-    assert any("Duplicate" in msg or "duplicate" in msg for msg in error_messages)
+    assert has_error_code(result.diagnostics, "RES-0010")
 
 
 # ============================================================================
@@ -445,108 +435,9 @@ def test_codegen_toplet_enum(tmp_path):
 # ============================================================================
 
 
-@pytest.mark.skipif(not _check_c_compiler_available(), reason="C compiler not available")
-def test_execute_toplet_primitives(tmp_path):
-    """Test execution of top-level let with primitives."""
-    write_tmp(tmp_path, "test.l0", """
-        module test;
-
-        let result: int = 42;
-
-        func main() -> int {
-            return result;
-        }
-    """)
-
-    driver = L0Driver()
-    driver.search_paths.add_project_root(tmp_path)
-    result = driver.analyze("test")
-
-    assert not result.has_errors()
-
-    backend = Backend(result)
-    c_code = backend.generate()
-
-    # Compile and run
-    c_file = tmp_path / "test.c"
-    c_file.write_text(c_code)
-
-    exe_path = tmp_path / "test_exe"
-
-    compile_result = subprocess.run(
-        ["gcc", "-std=c99", "-I", str(RUNTIME_PATH), str(c_file), "-o", str(exe_path)],
-        capture_output=True,
-        text=True
-    )
-
-    assert compile_result.returncode == 0, f"Compilation failed: {compile_result.stderr}"
-
-    run_result = subprocess.run([str(exe_path)], capture_output=True, text=True)
-    assert run_result.returncode == 42
-
-
-@pytest.mark.skipif(not _check_c_compiler_available(), reason="C compiler not available")
-def test_execute_toplet_mutation(tmp_path):
-    """Test mutation of top-level let."""
-    write_tmp(tmp_path, "test.l0", """
-        module test;
-
-        let counter: int = 0;
-
-        func increment() -> void {
-            counter = counter + 1;
-        }
-
-        func main() -> int {
-            increment();
-            increment();
-            increment();
-            return counter;
-        }
-    """)
-
-    driver = L0Driver()
-    driver.search_paths.add_project_root(tmp_path)
-    result = driver.analyze("test")
-
-    assert not result.has_errors()
-
-    backend = Backend(result)
-    c_code = backend.generate()
-
-    # Compile and run
-    c_file = tmp_path / "test.c"
-    c_file.write_text(c_code)
-
-    exe_path = tmp_path / "test_exe"
-
-    compile_result = subprocess.run(
-        ["gcc", "-std=c99", "-I", str(RUNTIME_PATH), str(c_file), "-o", str(exe_path)],
-        capture_output=True,
-        text=True
-    )
-
-    assert compile_result.returncode == 0
-
-    run_result = subprocess.run([str(exe_path)], capture_output=True, text=True)
-    assert run_result.returncode == 3
-
-
-@pytest.mark.skipif(not _check_c_compiler_available(), reason="C compiler not available")
-def test_execute_toplet_string_mutation(tmp_path):
-    """Test ARC-safe mutation of a top-level string."""
-    write_tmp(tmp_path, "test.l0", """
-        module test;
-        import std.string;
-
-        let greeting: string = "hi";
-
-        func main() -> int {
-            greeting = concat_s("a", "b");
-            greeting = concat_s(greeting, "c");
-            return len_s(greeting);
-        }
-    """)
+def _generate(tmp_path, src: str) -> str:
+    """Analyze `src` as module `test` and return the generated C code."""
+    write_tmp(tmp_path, "test.l0", src)
 
     driver = L0Driver()
     driver.search_paths.add_project_root(tmp_path)
@@ -555,116 +446,108 @@ def test_execute_toplet_string_mutation(tmp_path):
 
     assert not result.has_errors()
 
-    backend = Backend(result)
-    c_code = backend.generate()
-
-    c_file = tmp_path / "test.c"
-    c_file.write_text(c_code)
-
-    exe_path = tmp_path / "test_exe"
-
-    compile_result = subprocess.run(
-        ["gcc", "-std=c99", "-I", str(RUNTIME_PATH), str(c_file), "-o", str(exe_path)],
-        capture_output=True,
-        text=True
-    )
-
-    assert compile_result.returncode == 0
-
-    run_result = subprocess.run([str(exe_path)], capture_output=True, text=True)
-    assert run_result.returncode == 3
-
-
-@pytest.mark.skipif(not _check_c_compiler_available(), reason="C compiler not available")
-def test_execute_toplet_struct(tmp_path):
-    """Test execution with top-level struct let."""
-    write_tmp(tmp_path, "test.l0", """
-        module test;
-
-        struct Point {
-            x: int;
-            y: int;
-        }
-
-        let position = Point(10, 20);
-
-        func main() -> int {
-            return position.x + position.y;
-        }
-    """)
-
-    driver = L0Driver()
-    driver.search_paths.add_project_root(tmp_path)
-    result = driver.analyze("test")
-
-    assert not result.has_errors()
-
-    backend = Backend(result)
-    c_code = backend.generate()
-
-    # Compile and run
-    c_file = tmp_path / "test.c"
-    c_file.write_text(c_code)
-
-    exe_path = tmp_path / "test_exe"
-
-    compile_result = subprocess.run(
-        ["gcc", "-std=c99", "-I", str(RUNTIME_PATH), str(c_file), "-o", str(exe_path)],
-        capture_output=True,
-        text=True
-    )
-
-    assert compile_result.returncode == 0
-
-    run_result = subprocess.run([str(exe_path)], capture_output=True, text=True)
-    assert run_result.returncode == 30
+    return Backend(result).generate()
 
 
 @pytest.mark.skipif(not _check_c_compiler_available(), reason="C compiler not available")
-def test_execute_toplet_nested_struct(tmp_path):
-    """Test execution with nested struct initialization."""
-    write_tmp(tmp_path, "test.l0", """
-        module test;
-
-        struct Point {
-            x: int;
-            y: int;
-        }
-
-        struct Rectangle {
-            top_left: Point;
-            bottom_right: Point;
-        }
-
-        let rect = Rectangle(Point(0, 0), Point(10, 20));
-
-        func main() -> int {
-            return rect.bottom_right.x + rect.bottom_right.y;
-        }
-    """)
+@pytest.mark.parametrize(
+    ("src", "expected"),
+    [
+        pytest.param(
+            """
+            module test;
 
-    driver = L0Driver()
-    driver.search_paths.add_project_root(tmp_path)
-    result = driver.analyze("test")
+            let result: int = 42;
 
-    assert not result.has_errors()
+            func main() -> int {
+                return result;
+            }
+            """,
+            42,
+            id="primitives",
+        ),
+        pytest.param(
+            """
+            module test;
+
+            let counter: int = 0;
+
+            func increment() -> void {
+                counter = counter + 1;
+            }
 
-    backend = Backend(result)
-    c_code = backend.generate()
+            func main() -> int {
+                increment();
+                increment();
+                increment();
+                return counter;
+            }
+            """,
+            3,
+            id="mutation",
+        ),
+        pytest.param(
+            """
+            module test;
+            import std.string;
+
+            let greeting: string = "hi";
+
+            func main() -> int {
+                greeting = concat_s("a", "b");
+                greeting = concat_s(greeting, "c");
+                return len_s(greeting);
+            }
+            """,
+            3,
+            id="string_mutation",
+        ),
+        pytest.param(
+            """
+            module test;
+
+            struct Point {
+                x: int;
+                y: int;
+            }
 
-    # Compile and run
-    c_file = tmp_path / "test.c"
-    c_file.write_text(c_code)
+            let position = Point(10, 20);
 
-    exe_path = tmp_path / "test_exe"
+            func main() -> int {
+                return position.x + position.y;
+            }
+            """,
+            30,
+            id="struct",
+        ),
+        pytest.param(
+            """
+            module test;
+
+            struct Point {
+                x: int;
+                y: int;
+            }
 
-    compile_result = subprocess.run(
-        ["gcc", "-std=c99", "-I", str(RUNTIME_PATH), str(c_file), "-o", str(exe_path)],
-        capture_output=True,
-        text=True
-    )
+            struct Rectangle {
+                top_left: Point;
+                bottom_right: Point;
+            }
 
-    assert compile_result.returncode == 0
+            let rect = Rectangle(Point(0, 0), Point(10, 20));
 
-    run_result = subprocess.run([str(exe_path)], capture_output=True, text=True)
-    assert run_result.returncode == 30
+            func main() -> int {
+                return rect.bottom_right.x + rect.bottom_right.y;
+            }
+            """,
+            30,
+            id="nested_struct",
+        ),
+    ],
+)
+def test_execute_toplet(tmp_path, src, expected, compile_and_run):
+    """Test execution of programs initializing and mutating top-level lets."""
+    c_code = _generate(tmp_path, src)
+
+    success, _, stderr = compile_and_run(c_code, tmp_path, expected_exit_code=expected)
+    assert success, f"Program should exit {expected}: stderr={stderr}"
@@ -1,6 +1,8 @@
 #  SPDX-License-Identifier: MIT OR Apache-2.0
 #  Copyright (c) 2026 gwz
 
+import sys
+
 import pytest
 
 from l0_lexer import Lexer, TokenKind
@@ -103,6 +105,25 @@ def test_line_and_column_increment_across_newlines_and_comments():
     assert (let_tok.line, let_tok.column) == (3, 5)
 
 
+def test_line_and_column_after_block_comment_and_long_identifier():
+    src = "/* one\n   two */  some_long_name42 /**/ 123"
+
+    tokens = Lexer.from_source(src).tokenize()
+    ident_tok, int_tok = tokens[0], tokens[1]
+
+    assert (ident_tok.kind, ident_tok.text) == (TokenKind.IDENT, "some_long_name42")
+    assert (ident_tok.line, ident_tok.column) == (2, 12)
+    assert (int_tok.kind, int_tok.text) == (TokenKind.INT, "123")
+    assert (int_tok.line, int_tok.column) == (2, 34)
+
+
+def test_identifier_text_is_interned():
+    tokens = Lexer.from_source("Number value Number").tokenize()
+
+    assert tokens[0].text is tokens[2].text
+    assert tokens[0].text is sys.intern("Number")
+
+
 # ============================================================================
 # Escape sequence error tests
 # ============================================================================
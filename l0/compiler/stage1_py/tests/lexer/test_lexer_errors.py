@@ -26,6 +26,15 @@ def test_lexer_numeric_overflow_reports_span(analyze_single):
     assert (diag.line, diag.column) == (1, 1)
 
 
+def test_lexer_non_ascii_digit_after_integer_reports_span(analyze_single):
+    result = analyze_single("main", "1\u00b2")
+    assert result.has_errors()
+    assert has_error_code(result.diagnostics, "LEX-0040")
+
+    diag = _first_error(result)
+    assert (diag.line, diag.column) == (1, 2)
+
+
 def test_lexer_unterminated_string_reports_span(analyze_single):
     src = 'let msg = "unterminated\nnext line'
     result = analyze_single("main", src)
@@ -1,7 +1,9 @@
 #  SPDX-License-Identifier: MIT OR Apache-2.0
 #  Copyright (c) 2026 gwz
 
-from l0_string_escape import decode_l0_string_token, encode_c_string_bytes
+import pytest
+
+from l0_string_escape import EscapeDecodeError, decode_l0_string_token, encode_c_string_bytes
 
 
 def test_decode_l0_string_token_simple_ascii():
@@ -20,6 +22,18 @@ def test_decode_l0_string_token_unicode_to_utf8_bytes():
     assert decode_l0_string_token(r"\u20AC") == "€".encode("utf-8")
 
 
+def test_decode_l0_string_token_lenient_forms():
+    assert decode_l0_string_token(r"\x\q\8") == b"xq8"
+    assert decode_l0_string_token(r"\x1FF\1234") == b"\xff\x534"
+    assert decode_l0_string_token("end\\") == b"end\\"
+
+
+def test_decode_l0_string_token_rejects_short_unicode_escape():
+    with pytest.raises(EscapeDecodeError) as excinfo:
+        decode_l0_string_token(r"\u12")
+    assert excinfo.value.code == "invalid_unicode_escape"
+
+
 def test_encode_c_string_bytes_ascii_passthrough():
     assert encode_c_string_bytes(b"abcXYZ09") == "abcXYZ09"
 
@@ -2,11 +2,9 @@
 #  Copyright (c) 2026 gwz
 
 from conftest import has_error_code
-from l0_driver import L0Driver
-from l0_paths import SourceSearchPaths
 
 
-def test_qualified_expr_resolves_imported_symbol(write_l0_file, temp_project):
+def test_qualified_expr_resolves_imported_symbol(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "util.mod",
         """
@@ -28,15 +26,13 @@ def test_qualified_expr_resolves_imported_symbol(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
 
 
-def test_qualified_type_and_constructor(write_l0_file, temp_project):
+def test_qualified_type_and_constructor(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "shapes",
         """
@@ -60,15 +56,13 @@ def test_qualified_type_and_constructor(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
 
 
-def test_qualified_variant_pattern_with_current_module_name(write_l0_file, temp_project):
+def test_qualified_variant_pattern_with_current_module_name(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "colors",
         """
@@ -101,15 +95,13 @@ def test_qualified_variant_pattern_with_current_module_name(write_l0_file, temp_
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
 
 
-def test_qualified_expr_requires_import(write_l0_file, temp_project):
+def test_qualified_expr_requires_import(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "main",
         """
@@ -121,9 +113,7 @@ def test_qualified_expr_requires_import(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
@@ -131,7 +121,7 @@ def test_qualified_expr_requires_import(write_l0_file, temp_project):
     assert any("not imported" in diag.message for diag in result.diagnostics)
 
 
-def test_qualified_type_requires_import(write_l0_file, temp_project):
+def test_qualified_type_requires_import(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "main",
         """
@@ -141,16 +131,14 @@ def test_qualified_type_requires_import(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
     assert has_error_code(result.diagnostics, "SIG-0019")
 
 
-def test_qualified_variant_pattern(write_l0_file, temp_project):
+def test_qualified_variant_pattern(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "colors",
         """
@@ -182,15 +170,13 @@ def test_qualified_variant_pattern(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
 
 
-def test_qualified_variant_pattern_requires_import(write_l0_file, temp_project):
+def test_qualified_variant_pattern_requires_import(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "colors",
         """
@@ -221,9 +207,7 @@ def test_qualified_variant_pattern_requires_import(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
@@ -231,7 +215,7 @@ def test_qualified_variant_pattern_requires_import(write_l0_file, temp_project):
     assert any("not imported" in diag.message for diag in result.diagnostics)
 
 
-def test_qualified_variant_pattern_wrong_module(write_l0_file, temp_project):
+def test_qualified_variant_pattern_wrong_module(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "colors",
         """
@@ -271,16 +255,14 @@ def test_qualified_variant_pattern_wrong_module(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
     assert has_error_code(result.diagnostics, "TYP-0102")
 
 
-def test_unqualified_variant_conflict_is_error(write_l0_file, temp_project):
+def test_unqualified_variant_conflict_is_error(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "colors",
         """
@@ -320,9 +302,7 @@ def test_unqualified_variant_conflict_is_error(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     # Match variant patterns resolve against the scrutinee's enum type, not
@@ -332,7 +312,7 @@ def test_unqualified_variant_conflict_is_error(write_l0_file, temp_project):
     assert has_error_code(result.diagnostics, "RES-0022")
 
 
-def test_qualified_variant_disambiguates_conflict(write_l0_file, temp_project):
+def test_qualified_variant_disambiguates_conflict(write_l0_file, temp_project, driver_factory):
     write_l0_file(
         "colors",
         """
@@ -372,15 +352,13 @@ def test_qualified_variant_disambiguates_conflict(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
 
 
-def test_ambiguous_identifier_error_message(write_l0_file, temp_project):
+def test_ambiguous_identifier_error_message(write_l0_file, temp_project, driver_factory):
     """Bare use of an ambiguous symbol gives 'ambiguous' diagnostic with module names."""
     write_l0_file(
         "uno",
@@ -415,19 +393,17 @@ def test_ambiguous_identifier_error_message(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
-    typ_0155_diags = [d for d in result.diagnostics if "TYP-0155" in d.message]
+    typ_0155_diags = result.diagnostics_by_code().get("TYP-0155", [])
     assert len(typ_0155_diags) > 0
     assert any("ambiguous" in d.message for d in typ_0155_diags)
     assert any("uno" in d.message and "due" in d.message for d in typ_0155_diags)
 
 
-def test_ambiguous_call_identifier(write_l0_file, temp_project):
+def test_ambiguous_call_identifier(write_l0_file, temp_project, driver_factory):
     """Call syntax with an ambiguous symbol gives 'ambiguous' diagnostic."""
     write_l0_file(
         "uno",
@@ -461,19 +437,17 @@ def test_ambiguous_call_identifier(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
-    typ_0189_diags = [d for d in result.diagnostics if "TYP-0189" in d.message]
+    typ_0189_diags = result.diagnostics_by_code().get("TYP-0189", [])
     assert len(typ_0189_diags) > 0
     assert any("ambiguous" in d.message for d in typ_0189_diags)
     assert any("uno" in d.message and "due" in d.message for d in typ_0189_diags)
 
 
-def test_local_shadows_ambiguous_import(write_l0_file, temp_project):
+def test_local_shadows_ambiguous_import(write_l0_file, temp_project, driver_factory):
     """`let Red = 33` with ambiguous `Red` emits TYP-0024 warning."""
     write_l0_file(
         "uno",
@@ -507,20 +481,18 @@ def test_local_shadows_ambiguous_import(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     # Should not have errors (the local shadows the ambiguous name)
     assert not result.has_errors()
     # Should have TYP-0024 warning
     assert has_error_code(result.diagnostics, "TYP-0024")
-    typ_0024_diags = [d for d in result.diagnostics if "TYP-0024" in d.message]
+    typ_0024_diags = result.diagnostics_by_code().get("TYP-0024", [])
     assert any("ambiguous" in d.message for d in typ_0024_diags)
 
 
-def test_three_modules_ambiguous(write_l0_file, temp_project):
+def test_three_modules_ambiguous(write_l0_file, temp_project, driver_factory):
     """Three modules export `Red`; all three mentioned in diagnostic."""
     write_l0_file(
         "uno",
@@ -565,19 +537,17 @@ def test_three_modules_ambiguous(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
-    typ_0155_diags = [d for d in result.diagnostics if "TYP-0155" in d.message]
+    typ_0155_diags = result.diagnostics_by_code().get("TYP-0155", [])
     assert len(typ_0155_diags) > 0
     assert any("ambiguous" in d.message for d in typ_0155_diags)
     assert any("uno" in d.message and "due" in d.message and "tre" in d.message for d in typ_0155_diags)
 
 
-def test_local_shadows_imported_struct(write_l0_file, temp_project):
+def test_local_shadows_imported_struct(write_l0_file, temp_project, driver_factory):
     """`let Point = 5` with imported struct `Point` emits TYP-0025 warning."""
     write_l0_file(
         "shapes",
@@ -601,21 +571,19 @@ def test_local_shadows_imported_struct(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
     assert has_error_code(result.diagnostics, "TYP-0025")
-    typ_0025_diags = [d for d in result.diagnostics if "TYP-0025" in d.message]
+    typ_0025_diags = result.diagnostics_by_code().get("TYP-0025", [])
     assert any("shadows" in d.message and "struct" in d.message for d in typ_0025_diags)
 
 
 # --- overqualified name tests ---
 
 
-def test_overqualified_name_in_expression(write_l0_file, temp_project):
+def test_overqualified_name_in_expression(write_l0_file, temp_project, driver_factory):
     """color::Color::Red in expression position emits TYP-0158."""
     write_l0_file(
         "color",
@@ -642,14 +610,12 @@ def test_overqualified_name_in_expression(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
     assert has_error_code(result.diagnostics, "TYP-0158")
-    diags_0158 = [d for d in result.diagnostics if "TYP-0158" in d.message]
+    diags_0158 = result.diagnostics_by_code().get("TYP-0158", [])
     assert any(
         "nested symbol path 'color::Color::Red': paths must have the form 'module::symbol' "
         "(did you mean 'color::Red'?)" in d.message
@@ -657,7 +623,7 @@ def test_overqualified_name_in_expression(write_l0_file, temp_project):
     )
 
 
-def test_overqualified_name_in_type(write_l0_file, temp_project):
+def test_overqualified_name_in_type(write_l0_file, temp_project, driver_factory):
     """color::Color::Red used as a type emits SIG-0018."""
     write_l0_file(
         "color",
@@ -681,14 +647,12 @@ def test_overqualified_name_in_type(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
     assert has_error_code(result.diagnostics, "SIG-0018")
-    diags_0018 = [d for d in result.diagnostics if "SIG-0018" in d.message]
+    diags_0018 = result.diagnostics_by_code().get("SIG-0018", [])
     assert any(
         "nested symbol path 'color::Color::Red': paths must have the form 'module::symbol' "
         "(did you mean 'color::Red'?)" in d.message
@@ -696,7 +660,7 @@ def test_overqualified_name_in_type(write_l0_file, temp_project):
     )
 
 
-def test_overqualified_name_in_pattern(write_l0_file, temp_project):
+def test_overqualified_name_in_pattern(write_l0_file, temp_project, driver_factory):
     """color::Color::Red in match pattern emits TYP-0158."""
     write_l0_file(
         "color",
@@ -729,14 +693,12 @@ def test_overqualified_name_in_pattern(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
     assert has_error_code(result.diagnostics, "TYP-0158")
-    diags_0158 = [d for d in result.diagnostics if "TYP-0158" in d.message]
+    diags_0158 = result.diagnostics_by_code().get("TYP-0158", [])
     assert any(
         "nested symbol path 'color::Color::Red': paths must have the form 'module::symbol' "
         "(did you mean 'color::Red'?)" in d.message
@@ -744,7 +706,7 @@ def test_overqualified_name_in_pattern(write_l0_file, temp_project):
     )
 
 
-def test_triple_qualified_name(write_l0_file, temp_project):
+def test_triple_qualified_name(write_l0_file, temp_project, driver_factory):
     """a::B::C::D emits TYP-0158 with all segments mentioned."""
     write_l0_file(
         "a",
@@ -770,14 +732,12 @@ def test_triple_qualified_name(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert result.has_errors()
     assert has_error_code(result.diagnostics, "TYP-0158")
-    diags_0158 = [d for d in result.diagnostics if "TYP-0158" in d.message]
+    diags_0158 = result.diagnostics_by_code().get("TYP-0158", [])
     assert any(
         "nested symbol path 'a::B::C::D': paths must have the form 'module::symbol' "
         "(did you mean 'a::D'?)" in d.message
@@ -785,7 +745,7 @@ def test_triple_qualified_name(write_l0_file, temp_project):
     )
 
 
-def test_single_qualified_still_works(write_l0_file, temp_project):
+def test_single_qualified_still_works(write_l0_file, temp_project, driver_factory):
     """color::Red (no overqualification) still works without errors."""
     write_l0_file(
         "color",
@@ -812,9 +772,7 @@ def test_single_qualified_still_works(write_l0_file, temp_project):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(temp_project)
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(temp_project)
 
     result = driver.analyze("main")
     assert not result.has_errors()
@@ -3,19 +3,11 @@
 
 # test_l0_parser_ast_shapes.py
 
-from l0_ast import FuncDecl, FieldDecl, StructDecl, EnumVariant, EnumDecl, Module, Block, ReturnStmt, MatchStmt, \
+from l0_ast import FuncDecl, FieldDecl, StructDecl, EnumVariant, EnumDecl, Block, ReturnStmt, MatchStmt, \
     WildcardPattern, VariantPattern, IntLiteral, VarRef, BinaryOp, CallExpr
-from l0_parser import (
-    Parser,
-)
 
 
-def parse_module(src: str) -> Module:
-    parser = Parser.from_source(src)
-    return parser.parse_module()
-
-
-def test_struct_enum_and_match():
+def test_struct_enum_and_match(parse_module):
     src = """
     module demo;
 
@@ -1,19 +1,13 @@
 #  SPDX-License-Identifier: MIT OR Apache-2.0
 #  Copyright (c) 2026 gwz
 
+import pytest
+
 from l0_ast import FuncDecl, Module, Block, LetStmt, AssignStmt, IfStmt, ReturnStmt, IntLiteral, BoolLiteral, VarRef, \
     UnaryOp, BinaryOp, CallExpr, IndexExpr, FieldAccessExpr, ParenExpr, CastExpr
-from l0_parser import (
-    Parser,
-)
-
-
-def parse_module(src: str) -> Module:
-    parser = Parser.from_source(src)
-    return parser.parse_module()
 
 
-def test_if_else_and_assignment():
+def test_if_else_and_assignment(parse_module):
     src = """
     module control;
 
@@ -85,7 +79,7 @@ def test_if_else_and_assignment():
     assert ret_else.value.value == 0
 
 
-def test_expression_precedence_and_postfix():
+def test_expression_precedence_and_postfix(parse_module):
     src = """
     module expr;
 
@@ -116,70 +110,35 @@ def test_expression_precedence_and_postfix():
     # let x: int = 1 + 2 * 3;
     let_x = stmts[0]
     assert isinstance(let_x, LetStmt)
-    x_expr = let_x.value
-    assert isinstance(x_expr, BinaryOp)
-    assert x_expr.op == "+"
-    assert isinstance(x_expr.left, IntLiteral)
-    assert x_expr.left.value == 1
-    assert isinstance(x_expr.right, BinaryOp)
-    assert x_expr.right.op == "*"
-    assert isinstance(x_expr.right.left, IntLiteral)
-    assert x_expr.right.left.value == 2
-    assert isinstance(x_expr.right.right, IntLiteral)
-    assert x_expr.right.right.value == 3
+    match let_x.value:
+        case BinaryOp("+", IntLiteral(1), BinaryOp("*", IntLiteral(2), IntLiteral(3))):
+            pass
+        case other:
+            pytest.fail(f"unexpected shape for '1 + 2 * 3': {other!r}")
 
     # let y: int = (1 + 2) * 3;
+    # left side should be a ParenExpr wrapping 1 + 2
     let_y = stmts[1]
     assert isinstance(let_y, LetStmt)
-    y_expr = let_y.value
-    assert isinstance(y_expr, BinaryOp)
-    assert y_expr.op == "*"
-    assert isinstance(y_expr.right, IntLiteral)
-    assert y_expr.right.value == 3
-
-    # left side should be a ParenExpr wrapping 1 + 2
-    assert isinstance(y_expr.left, ParenExpr)
-    inner = y_expr.left.inner
-    assert isinstance(inner, BinaryOp)
-    assert inner.op == "+"
-    assert isinstance(inner.left, IntLiteral)
-    assert inner.left.value == 1
-    assert isinstance(inner.right, IntLiteral)
-    assert inner.right.value == 2
+    match let_y.value:
+        case BinaryOp("*", ParenExpr(BinaryOp("+", IntLiteral(1), IntLiteral(2))), IntLiteral(3)):
+            pass
+        case other:
+            pytest.fail(f"unexpected shape for '(1 + 2) * 3': {other!r}")
 
     # let z: bool = a == b || b == c && true;
+    # && binds tighter than ||
     let_z = stmts[2]
     assert isinstance(let_z, LetStmt)
-    z_expr = let_z.value
-    assert isinstance(z_expr, BinaryOp)
-    assert z_expr.op == "||"
-
-    left_or = z_expr.left
-    right_or = z_expr.right
-
-    # left side: a == b
-    assert isinstance(left_or, BinaryOp)
-    assert left_or.op == "=="
-    assert isinstance(left_or.left, VarRef)
-    assert left_or.left.name == "a"
-    assert isinstance(left_or.right, VarRef)
-    assert left_or.right.name == "b"
-
-    # right side: b == c && true  (&& binds tighter than ||)
-    assert isinstance(right_or, BinaryOp)
-    assert right_or.op == "&&"
-    left_and = right_or.left
-    right_and = right_or.right
-
-    assert isinstance(left_and, BinaryOp)
-    assert left_and.op == "=="
-    assert isinstance(left_and.left, VarRef)
-    assert left_and.left.name == "b"
-    assert isinstance(left_and.right, VarRef)
-    assert left_and.right.name == "c"
-
-    assert isinstance(right_and, BoolLiteral)
-    assert right_and.value is True
+    match let_z.value:
+        case BinaryOp(
+            "||",
+            BinaryOp("==", VarRef("a"), VarRef("b")),
+            BinaryOp("&&", BinaryOp("==", VarRef("b"), VarRef("c")), BoolLiteral(True)),
+        ):
+            pass
+        case other:
+            pytest.fail(f"unexpected shape for 'a == b || b == c && true': {other!r}")
 
     # let idx: int = arr[i];
     let_idx = stmts[3]
@@ -2,15 +2,9 @@
 #  Copyright (c) 2026 gwz
 
 from conftest import has_error_code
-from l0_parser import Parser
 
 
-def parse_module(src: str):
-    parser = Parser.from_source(src)
-    return parser.parse_module()
-
-
-def test_parser_decls_valid_module_imports_and_defs():
+def test_parser_decls_valid_module_imports_and_defs(parse_module):
     src = """
     module main;
     import std.io;
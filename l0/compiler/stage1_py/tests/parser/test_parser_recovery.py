@@ -18,7 +18,7 @@ def test_parser_recovery_from_missing_semicolon(analyze_single):
         return 2;
     }
     """
-    result = analyze_single("main", src)
+    result = analyze_single("main", src, stop_after="parse")
 
     assert result.has_errors()
     assert result.cu is not None
@@ -43,7 +43,7 @@ def test_parser_recovery_from_missing_import_semicolon(analyze_single):
         return x;
     }
     """
-    result = analyze_single("main", src)
+    result = analyze_single("main", src, stop_after="parse")
 
     assert result.has_errors()
     assert result.cu is not None
@@ -3,15 +3,9 @@
 
 from conftest import has_error_code
 from l0_ast import StructDecl, TypeAliasDecl, FuncDecl
-from l0_parser import Parser
 
 
-def parse_module(src: str):
-    parser = Parser.from_source(src)
-    return parser.parse_module()
-
-
-def test_parser_types_valid_pointer_and_nullable():
+def test_parser_types_valid_pointer_and_nullable(parse_module):
     src = """
     module main;
 
@@ -1,16 +1,10 @@
 #  SPDX-License-Identifier: MIT OR Apache-2.0
 #  Copyright (c) 2026 gwz
 
-from l0_ast import FuncDecl, Module
-from l0_parser import Parser
+from l0_ast import FuncDecl
 
 
-def parse_module(src: str) -> Module:
-    parser = Parser.from_source(src)
-    return parser.parse_module()
-
-
-def test_extern_and_types():
+def test_extern_and_types(parse_module):
     src = """
     module stdio;
 
@@ -5,9 +5,7 @@ import textwrap
 from pathlib import Path
 
 from conftest import has_error_code
-from l0_driver import L0Driver
 from l0_name_resolver import NameResolver
-from l0_paths import SourceSearchPaths
 from l0_signatures import SignatureResolver
 from l0_types import (
     BuiltinType,
@@ -26,7 +24,7 @@ def _write(tmp_root: Path, rel: str, content: str) -> Path:
     return path
 
 
-def test_signature_resolution_across_modules(tmp_path):
+def test_signature_resolution_across_modules(tmp_path, driver_factory):
     """
     types module defines:
       - struct Number { value: int; }
@@ -74,10 +72,7 @@ def test_signature_resolution_across_modules(tmp_path):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(proj_root)
-
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(proj_root)
     cu = driver.build_compilation_unit("app.main")
 
     # Module-level name resolution
@@ -115,7 +110,7 @@ def test_signature_resolution_across_modules(tmp_path):
     assert sr.diagnostics == []
 
 
-def test_unknown_type_produces_diagnostic(tmp_path):
+def test_unknown_type_produces_diagnostic(tmp_path, driver_factory):
     """
     Using an unknown type in a function parameter should produce a diagnostic
     and leave the function without a resolved type.
@@ -135,10 +130,7 @@ def test_unknown_type_produces_diagnostic(tmp_path):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(proj_root)
-
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(proj_root)
     cu = driver.build_compilation_unit("mod")
 
     nr = NameResolver(cu)
@@ -160,7 +152,7 @@ def test_unknown_type_produces_diagnostic(tmp_path):
 # New aliasing tests
 # ---------------------------------------------------------------------------
 
-def test_type_alias_chains_and_structs(tmp_path):
+def test_type_alias_chains_and_structs(tmp_path, driver_factory):
     """
     Single module with:
       - struct Pair { a: int; b: int; }
@@ -193,10 +185,7 @@ def test_type_alias_chains_and_structs(tmp_path):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(proj_root)
-
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(proj_root)
     cu = driver.build_compilation_unit("mod")
 
     nr = NameResolver(cu)
@@ -237,7 +226,7 @@ def test_type_alias_chains_and_structs(tmp_path):
     assert sr.diagnostics == []
 
 
-def test_cyclic_type_aliases_produce_diagnostics(tmp_path):
+def test_cyclic_type_aliases_produce_diagnostics(tmp_path, driver_factory):
     """
     Detect simple cyclic aliases:
 
@@ -260,10 +249,7 @@ def test_cyclic_type_aliases_produce_diagnostics(tmp_path):
         """,
     )
 
-    paths = SourceSearchPaths()
-    paths.add_project_root(proj_root)
-
-    driver = L0Driver(search_paths=paths)
+    driver = driver_factory(proj_root)
     cu = driver.build_compilation_unit("mod")
 
     nr = NameResolver(cu)
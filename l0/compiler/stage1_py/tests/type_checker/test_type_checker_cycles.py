@@ -10,6 +10,7 @@ Pointer-type fields break cycles (forward declarations work).
 
 from textwrap import dedent
 
+from conftest import has_error_code
 from l0_driver import L0Driver
 
 
@@ -57,7 +58,7 @@ def test_direct_struct_cycle(tmp_path):
 
     # Should have cycle error
     assert result.has_errors()
-    assert any("cycle" in diag.message.lower() for diag in result.diagnostics)
+    assert has_error_code(result.diagnostics, "SIG-0040")
 
 
 # ============================================================================
@@ -93,7 +94,7 @@ def test_indirect_struct_cycle(tmp_path):
 
     # Should have cycle error
     assert result.has_errors()
-    assert any("cycle" in diag.message.lower() for diag in result.diagnostics)
+    assert has_error_code(result.diagnostics, "SIG-0040")
 
 
 # ============================================================================
@@ -121,7 +122,7 @@ def test_direct_enum_cycle(tmp_path):
 
     # Should have cycle error
     assert result.has_errors()
-    assert any("cycle" in diag.message.lower() for diag in result.diagnostics)
+    assert has_error_code(result.diagnostics, "SIG-0040")
 
 
 # ============================================================================
@@ -153,7 +154,7 @@ def test_struct_enum_cycle(tmp_path):
 
     # Should have cycle error
     assert result.has_errors()
-    assert any("cycle" in diag.message.lower() for diag in result.diagnostics)
+    assert has_error_code(result.diagnostics, "SIG-0040")
 
 
 # ============================================================================
@@ -218,7 +219,7 @@ def test_value_optional_cycle(tmp_path):
 
     # Should have cycle error - value-optional still creates dependency
     assert result.has_errors()
-    assert any("cycle" in diag.message.lower() for diag in result.diagnostics)
+    assert has_error_code(result.diagnostics, "SIG-0040")
 
 
 # ============================================================================
@@ -270,4 +271,4 @@ def test_cross_module_cycle(tmp_path):
 
     # Should have cycle error
     assert result.has_errors()
-    assert any("cycle" in diag.message.lower() for diag in result.diagnostics)
+    assert has_error_code(result.diagnostics, "SIG-0040")
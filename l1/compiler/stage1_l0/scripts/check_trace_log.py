@@ -6,18 +6,20 @@ import argparse
 import re
 import sys
 from collections import Counter, defaultdict
+from collections.abc import Iterable
 from pathlib import Path
-from textwrap import dedent
 
-TRACE_RE = re.compile(r"^\[l0\]\[(mem|arc)\]\s+(.*)$")
+TRACE_PREFIX = "[l0]["
+TRACE_RE = re.compile(r"\s*\[l0\]\[(mem|arc)\]\s+(.*)")
 KV_RE = re.compile(r"(\w+)=([^\s]+)")
 
 
-def _parse_events(text: str) -> tuple[list[dict[str, str]], list[str]]:
+def _parse_events(lines: Iterable[str]) -> tuple[list[dict[str, str]], list[str]]:
     """Parse raw trace output into structured event dictionaries.
 
     Args:
-        text: Trace log text, typically captured from Stage 1 stderr.
+        lines: Trace log lines, typically read from captured Stage 1 stderr.
+            Trailing newlines are ignored.
 
     Returns:
         A pair containing the parsed events and non-fatal parse warnings.
@@ -29,17 +31,17 @@ def _parse_events(text: str) -> tuple[list[dict[str, str]], list[str]]:
     events: list[dict[str, str]] = []
     warnings: list[str] = []
 
-    normalized = dedent(text)
-
-    for line_no, raw in enumerate(normalized.splitlines(), start=1):
-        m = TRACE_RE.match(raw.lstrip())
+    for line_no, raw in enumerate(lines, start=1):
+        if TRACE_PREFIX not in raw:
+            continue
+        m = TRACE_RE.match(raw.rstrip("\n"))
         if not m:
             continue
 
         family = m.group(1)
         payload = m.group(2)
         fields = dict(KV_RE.findall(payload))
-        event = {"family": family, "line_no": str(line_no), "raw": raw}
+        event = {"family": family, "line_no": str(line_no)}
         event.update(fields)
         events.append(event)
 
@@ -110,7 +112,7 @@ def _validate_events(events: list[dict[str, str]]) -> tuple[list[str], list[str]
             elif op == "free" and action == "call" and ptr:
                 # Compatibility path: some object pointers may be finalized by direct free().
                 # Treat it as a release for balance accounting, but surface it as a warning.
-                if obj_balance[ptr] > 0:
+                if obj_balance.get(ptr, 0) > 0:
                     obj_balance[ptr] -= 1
                     warnings.append(
                         f"line {line_no}: new_alloc ptr={ptr} released via mem op=free action=call (preferred: drop/free)"
@@ -130,8 +132,7 @@ def _validate_events(events: list[dict[str, str]]) -> tuple[list[str], list[str]
                 pass
             elif op == "free_string" and action:
                 warnings.append(f"line {line_no}: free_string has uncommon action={action}")
-
-        if family == "arc":
+        elif family == "arc":
             if action and action.startswith("panic"):
                 errors.append(f"line {line_no}: arc panic action detected ({action})")
 
@@ -238,13 +239,12 @@ def _print_report(
     See Also:
         `_validate_events`: Produces the summary and triage data rendered here.
     """
-    mem_count = sum(1 for e in events if e["family"] == "mem")
-    arc_count = sum(1 for e in events if e["family"] == "arc")
+    family_counts = Counter(e["family"] for e in events)
     total_warnings = parse_warnings + warnings
 
     print("stats:")
-    print(f"  mem_events={mem_count}")
-    print(f"  arc_events={arc_count}")
+    print(f"  mem_events={family_counts['mem']}")
+    print(f"  arc_events={family_counts['arc']}")
     print(f"  total_events={len(events)}")
     print(f"  errors={len(errors)}")
     print(f"  warnings={len(total_warnings)}")
@@ -365,12 +365,12 @@ def main(argv: list[str]) -> int:
         return 2
 
     try:
-        text = trace_path.read_text(encoding="utf-8")
+        with trace_path.open("r", encoding="utf-8") as trace_file:
+            events, parse_warnings = _parse_events(trace_file)
     except OSError as exc:
         print(f"error: failed to read trace file {trace_path}: {exc}")
         return 2
 
-    events, parse_warnings = _parse_events(text)
     errors, warnings, op_counts, triage = _validate_events(events)
     _print_report(
         events,